@@ -475,7 +475,7 @@ class P6Tools:
             # Get activity
             activity_df = self.activity_dao.get_activity_by_id(activity_id, project_id)
             
-            if activity_df.empty:
+            if activity_df is None or activity_df.empty:
                 return json.dumps({
                     "success": False,
                     "error": f"Activity not found: {activity_id}"
@@ -523,7 +523,7 @@ class P6Tools:
             # Get activity to find project
             activity_df = self.activity_dao.get_activity_by_object_id(activity_object_id)
             
-            if activity_df.empty:
+            if activity_df is None or activity_df.empty:
                 return json.dumps({
                     "success": False,
                     "error": f"Activity not found: {activity_object_id}"
@@ -575,7 +575,7 @@ class P6Tools:
             # Get current activity state
             activity_df = self.activity_dao.get_activity_by_object_id(activity_object_id)
             
-            if activity_df.empty:
+            if activity_df is None or activity_df.empty:
                 return json.dumps({
                     "success": False,
                     "error": f"Activity not found: {activity_object_id}"
@@ -657,7 +657,7 @@ class P6Tools:
             # Get activity
             activity_df = self.activity_dao.get_activity_by_object_id(activity_object_id)
             
-            if activity_df.empty:
+            if activity_df is None or activity_df.empty:
                 return json.dumps({
                     "success": False,
                     "error": f"Activity not found: {activity_object_id}"
@@ -1069,7 +1069,7 @@ class P6Tools:
                 # Get updated activity to confirm changes
                 updated_activity_df = self.activity_dao.get_activity_by_object_id(activity_object_id)
                 
-                if updated_activity_df.empty:
+                if updated_activity_df is None or updated_activity_df.empty:
                     return json.dumps({
                         "success": False,
                         "error": "Activity not found after update"
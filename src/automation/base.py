@@ -333,6 +333,8 @@ class P6AutomationBase:
         """
         Capture screenshot on error.
         
+        Waits for the PNG to be written, so a returned path always exists.
+        
         Args:
             error_name: Name for the screenshot file
             
@@ -343,7 +345,7 @@ class P6AutomationBase:
             if self._main_window:
                 timestamp = get_timestamp()
                 filename = f"p6_error_{error_name}_{timestamp}.png"
-                return capture_screenshot(self._main_window, filename)
+                return capture_screenshot(self._main_window, filename, wait=True)
         except Exception as e:
             logger.warning(f"Failed to capture error screenshot: {e}")
         return None
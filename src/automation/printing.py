@@ -9,6 +9,7 @@ Provides comprehensive print and export automation for P6 Professional:
 - Print dialog handling
 """
 
+import re
 import time
 from pathlib import Path
 from typing import Optional, Dict, Tuple
@@ -17,10 +18,19 @@ from enum import Enum
 try:
     from pywinauto import Desktop
     from pywinauto.findwindows import ElementNotFoundError
+    from pywinauto.uia_defines import IUIA
+    from pywinauto.uia_element_info import UIAElementInfo
+    from pywinauto.controls.uiawrapper import UIAWrapper
     PYWINAUTO_AVAILABLE = True
 except ImportError:
     PYWINAUTO_AVAILABLE = False
 
+try:
+    import win32print
+    WIN32PRINT_AVAILABLE = True
+except ImportError:
+    WIN32PRINT_AVAILABLE = False
+
 from src.config import PDF_PRINTER_NAME, PDF_OUTPUT_DIR
 from src.utils import logger
 from .exceptions import (
@@ -65,22 +75,40 @@ class P6PrintManager:
         This class is NOT thread-safe.
     """
     
+    # DEVMODE values (wingdi.h DMORIENT_* / DMPAPER_*)
+    DM_OUT_BUFFER = 2
+    DEVMODE_ORIENTATION = {
+        PageOrientation.PORTRAIT: 1,
+        PageOrientation.LANDSCAPE: 2,
+    }
+    DEVMODE_PAPER_SIZE = {
+        PageSize.LETTER: 1,
+        PageSize.TABLOID: 3,
+        PageSize.LEGAL: 5,
+        PageSize.A3: 8,
+        PageSize.A4: 9,
+    }
+    
     # Dialog patterns
     PRINT_PREVIEW_TITLE = "Print Preview"
     PRINT_DIALOG_TITLE = "Print"
     PAGE_SETUP_TITLE = "Page Setup"
     SAVE_DIALOG_TITLE = "Save Print Output As"
+    _RE_PRINT_PREVIEW = f".*{PRINT_PREVIEW_TITLE}.*"
     
     # Timing
     DIALOG_TIMEOUT = 15
     PRINT_TIMEOUT = 30
     ACTION_DELAY = 0.5
+    FOCUS_TIMEOUT = 0.5
+    FOCUS_POLL = 0.02
     
     def __init__(
         self,
         main_window,
         pdf_printer: Optional[str] = None,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        trust_printer_defaults: bool = False
     ):
         """
         Initialize print manager.
@@ -89,8 +117,13 @@ class P6PrintManager:
             main_window: P6 main window wrapper
             pdf_printer: Name of PDF printer
             output_dir: Directory for PDF output
+            trust_printer_defaults: Skip the Page Setup dialog when the PDF
+                printer's default DEVMODE already matches the request. Off by
+                default: P6 applies the layout's own page setup, which can
+                differ from the printer default.
         """
         self._window = main_window
+        self.trust_printer_defaults = trust_printer_defaults
         self.pdf_printer = pdf_printer or PDF_PRINTER_NAME or "Microsoft Print to PDF"
         self.output_dir = Path(output_dir or PDF_OUTPUT_DIR or "reports/pdf")
         
@@ -99,11 +132,37 @@ class P6PrintManager:
         
         # Track state
         self._in_print_preview = False
+        self._page_setup_dialog = None
+        self._page_setup_cache = None
         
         logger.debug(f"P6PrintManager initialized")
         logger.debug(f"  PDF Printer: {self.pdf_printer}")
         logger.debug(f"  Output Dir: {self.output_dir}")
     
+    # =========================================================================
+    # Focus
+    # =========================================================================
+    
+    def _ensure_focused(self, timeout: float = None) -> bool:
+        """
+        Wait until the P6 main window reports itself active.
+        
+        Returns as soon as focus is confirmed instead of sleeping a fixed
+        ACTION_DELAY after every set_focus().
+        
+        Args:
+            timeout: Maximum wait time (defaults to FOCUS_TIMEOUT)
+            
+        Returns:
+            True if the window is active
+        """
+        return wait_for_condition(
+            condition=self._window.is_active,
+            timeout=timeout or self.FOCUS_TIMEOUT,
+            poll_interval=self.FOCUS_POLL,
+            description="P6 main window focus"
+        )
+    
     # =========================================================================
     # Print Preview
     # =========================================================================
@@ -119,7 +178,7 @@ class P6PrintManager:
         
         try:
             self._window.set_focus()
-            time.sleep(self.ACTION_DELAY)
+            self._ensure_focused()
             
             # Use menu: File -> Print Preview
             self._window.menu_select("File->Print Preview")
@@ -127,7 +186,7 @@ class P6PrintManager:
             
             # Verify print preview window opened
             preview = self._find_print_preview_window()
-            if preview:
+            if preview is not None:
                 self._in_print_preview = True
                 logger.info("✓ Print preview opened")
                 return True
@@ -148,7 +207,7 @@ class P6PrintManager:
         
         try:
             preview = self._find_print_preview_window()
-            if preview:
+            if preview is not None:
                 preview.close()
                 time.sleep(self.ACTION_DELAY)
             
@@ -161,22 +220,30 @@ class P6PrintManager:
             return False
     
     def _find_print_preview_window(self):
-        """Find the print preview window."""
+        """
+        Find the print preview window.
+        
+        Returns:
+            Print preview wrapper, or None if not open
+        """
+        # Print preview is normally hosted by the P6 process itself
         try:
-            # Print preview may be part of main app or separate window
-            preview = Desktop(backend="uia").window(
-                title_re=f".*{self.PRINT_PREVIEW_TITLE}.*"
-            )
-            if preview.exists():
-                return preview
-        except Exception:
+            return self._window.child_window(
+                title_re=self._RE_PRINT_PREVIEW,
+                control_type="Window",
+                top_level_only=False
+            ).wrapper_object()
+        except ElementNotFoundError:
             pass
+        except Exception as e:
+            logger.debug(f"Print preview child lookup failed: {e}")
         
-        # Try as child of main window
+        # Fall back to a separate top-level window owned by P6
         try:
-            return self._window.child_window(
-                title_re=f".*{self.PRINT_PREVIEW_TITLE}.*"
-            )
+            return Desktop(backend="uia").window(
+                title_re=self._RE_PRINT_PREVIEW,
+                process=self._window.process_id()
+            ).wrapper_object()
         except Exception:
             return None
     
@@ -195,7 +262,7 @@ class P6PrintManager:
         
         try:
             self._window.set_focus()
-            time.sleep(self.ACTION_DELAY)
+            self._ensure_focused()
             
             # File -> Page Setup
             self._window.menu_select("File->Page Setup...")
@@ -207,12 +274,154 @@ class P6PrintManager:
             )
             dialog.wait("ready", timeout=self.DIALOG_TIMEOUT)
             
+            self._bind_page_setup_dialog(dialog)
+            
             logger.info("✓ Page setup dialog opened")
             return True
             
         except Exception as e:
             raise P6PrintError(f"Failed to open page setup: {e}")
     
+    def _bind_page_setup_dialog(self, dialog):
+        """Bind the Page Setup dialog and pre-warm its UIA cache."""
+        self._page_setup_dialog = dialog
+        self._page_setup_cache = self._build_uia_cache(dialog)
+    
+    def _release_page_setup_dialog(self):
+        """Forget the bound Page Setup dialog once it has been closed."""
+        self._page_setup_dialog = None
+        self._page_setup_cache = None
+    
+    def _get_page_setup_dialog(self):
+        """
+        Get the Page Setup dialog, opening it if needed.
+        
+        Returns:
+            Page Setup dialog window specification
+        """
+        if self._page_setup_dialog is None:
+            dialog = Desktop(backend="uia").window(
+                title_re=f".*{self.PAGE_SETUP_TITLE}.*"
+            )
+            if dialog.exists():
+                self._bind_page_setup_dialog(dialog)
+            else:
+                self.open_page_setup()
+        return self._page_setup_dialog
+    
+    def _build_uia_cache(self, dialog):
+        """
+        Snapshot Name/ControlType/AutomationId for a whole dialog subtree.
+        
+        A UIA CacheRequest fetches the properties of every descendant in a
+        single cross-process call, so later control lookups can be resolved
+        in-process instead of issuing COM reads per control.
+        
+        Args:
+            dialog: Dialog window specification to snapshot
+            
+        Returns:
+            Cached IUIAutomationElement, or None if caching is unavailable
+        """
+        try:
+            uia = IUIA()
+            request = uia.iuia.CreateCacheRequest()
+            request.AddProperty(uia.UIA_dll.UIA_NamePropertyId)
+            request.AddProperty(uia.UIA_dll.UIA_ControlTypePropertyId)
+            request.AddProperty(uia.UIA_dll.UIA_AutomationIdPropertyId)
+            request.TreeScope = uia.UIA_dll.TreeScope_Subtree
+            element = dialog.wrapper_object().element_info.element
+            return element.BuildUpdatedCache(request)
+        except Exception as e:
+            logger.debug(f"UIA cache request failed: {e}")
+            return None
+    
+    def _find_cached_control(
+        self,
+        control_type: str,
+        title_re: Optional[str] = None,
+        found_index: int = 0
+    ):
+        """
+        Find a Page Setup control from the pre-warmed UIA cache.
+        
+        Args:
+            control_type: UIA control type name (e.g. "RadioButton")
+            title_re: Optional regex the control name must match
+            found_index: Index among matching controls (document order)
+            
+        Returns:
+            Control wrapper, or None if not cached or not found
+        """
+        if self._page_setup_cache is None:
+            return None
+        
+        try:
+            type_id = IUIA().known_control_types[control_type]
+            pattern = re.compile(title_re) if title_re else None
+            
+            matches = 0
+            stack = [self._page_setup_cache]
+            while stack:
+                element = stack.pop()
+                if element.CachedControlType == type_id and (
+                    pattern is None or pattern.match(element.CachedName or "")
+                ):
+                    if matches == found_index:
+                        return UIAWrapper(UIAElementInfo(element))
+                    matches += 1
+                
+                children = element.GetCachedChildren()
+                if children:
+                    stack.extend(
+                        children.GetElement(i)
+                        for i in reversed(range(children.Length))
+                    )
+        except Exception as e:
+            logger.debug(f"Cached control lookup failed: {e}")
+        
+        return None
+    
+    def _use_page_setup_control(
+        self,
+        dialog,
+        action,
+        control_type: str,
+        title_re: Optional[str] = None,
+        found_index: int = 0
+    ):
+        """
+        Run an action on a Page Setup control, preferring the UIA cache.
+        
+        Falls back to a live child_window lookup when the control is not
+        cached or the cached element turns out to be stale (the action
+        raises), dropping the cache so later lookups go live too.
+        
+        Args:
+            dialog: Page Setup dialog window specification
+            action: Callable receiving the control wrapper
+            control_type: UIA control type name (e.g. "RadioButton")
+            title_re: Optional regex the control name must match
+            found_index: Index among matching controls (document order)
+            
+        Returns:
+            The action's return value
+        """
+        cached = self._find_cached_control(
+            control_type, title_re=title_re, found_index=found_index
+        )
+        if cached is not None:
+            try:
+                return action(cached)
+            except Exception as e:
+                logger.debug(f"Cached {control_type} is stale, using live lookup: {e}")
+                self._page_setup_cache = None
+        
+        criteria = {"control_type": control_type, "found_index": found_index}
+        if title_re:
+            criteria["title_re"] = title_re
+        return action(dialog.child_window(**criteria).wrapper_object())
+    
     def set_page_orientation(self, orientation: PageOrientation) -> bool:
         """
         Set page orientation.
@@ -226,30 +435,20 @@ class P6PrintManager:
         logger.info(f"Setting orientation: {orientation.value}")
         
         try:
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.PAGE_SETUP_TITLE}.*"
-            )
-            
-            if not dialog.exists():
-                # Open page setup first
-                self.open_page_setup()
-                dialog = Desktop(backend="uia").window(
-                    title_re=f".*{self.PAGE_SETUP_TITLE}.*"
-                )
+            dialog = self._get_page_setup_dialog()
             
             # Find orientation radio buttons
             if orientation == PageOrientation.LANDSCAPE:
-                radio = dialog.child_window(
-                    title_re=".*Landscape.*",
-                    control_type="RadioButton"
-                )
+                title_re = ".*Landscape.*"
             else:
-                radio = dialog.child_window(
-                    title_re=".*Portrait.*",
-                    control_type="RadioButton"
-                )
+                title_re = ".*Portrait.*"
             
-            radio.click_input()
+            self._use_page_setup_control(
+                dialog,
+                lambda radio: radio.click_input(),
+                "RadioButton",
+                title_re=title_re
+            )
             time.sleep(self.ACTION_DELAY)
             
             logger.info(f"✓ Orientation set to {orientation.value}")
@@ -272,22 +471,14 @@ class P6PrintManager:
         logger.info(f"Setting page size: {size.value}")
         
         try:
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.PAGE_SETUP_TITLE}.*"
-            )
-            
-            if not dialog.exists():
-                self.open_page_setup()
-                dialog = Desktop(backend="uia").window(
-                    title_re=f".*{self.PAGE_SETUP_TITLE}.*"
-                )
+            dialog = self._get_page_setup_dialog()
             
             # Find paper size combo box
-            paper_combo = dialog.child_window(
-                control_type="ComboBox",
-                found_index=0
+            self._use_page_setup_control(
+                dialog,
+                lambda paper_combo: paper_combo.select(size.value),
+                "ComboBox"
             )
-            paper_combo.select(size.value)
             time.sleep(self.ACTION_DELAY)
             
             logger.info(f"✓ Page size set to {size.value}")
@@ -305,16 +496,24 @@ class P6PrintManager:
             True if applied successfully
         """
         try:
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.PAGE_SETUP_TITLE}.*"
-            )
-            
-            if dialog.exists():
-                ok_button = dialog.child_window(
-                    title="OK",
-                    control_type="Button"
+            dialog = self._page_setup_dialog
+            if dialog is None:
+                dialog = Desktop(backend="uia").window(
+                    title_re=f".*{self.PAGE_SETUP_TITLE}.*"
                 )
-                ok_button.click_input()
+                if not dialog.exists():
+                    dialog = None
+            
+            if dialog is not None:
+                try:
+                    self._use_page_setup_control(
+                        dialog,
+                        lambda ok_button: ok_button.click_input(),
+                        "Button",
+                        title_re="OK$"
+                    )
+                finally:
+                    self._release_page_setup_dialog()
                 time.sleep(self.ACTION_DELAY)
                 logger.info("✓ Page setup applied")
                 return True
@@ -327,16 +526,24 @@ class P6PrintManager:
     def cancel_page_setup(self) -> bool:
         """Cancel and close page setup dialog."""
         try:
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.PAGE_SETUP_TITLE}.*"
-            )
-            
-            if dialog.exists():
-                cancel_button = dialog.child_window(
-                    title="Cancel",
-                    control_type="Button"
+            dialog = self._page_setup_dialog
+            if dialog is None:
+                dialog = Desktop(backend="uia").window(
+                    title_re=f".*{self.PAGE_SETUP_TITLE}.*"
                 )
-                cancel_button.click_input()
+                if not dialog.exists():
+                    dialog = None
+            
+            if dialog is not None:
+                try:
+                    self._use_page_setup_control(
+                        dialog,
+                        lambda cancel_button: cancel_button.click_input(),
+                        "Button",
+                        title_re="Cancel$"
+                    )
+                finally:
+                    self._release_page_setup_dialog()
                 return True
                 
         except Exception:
@@ -344,6 +551,61 @@ class P6PrintManager:
         
         return False
     
+    def _read_current_devmode(self):
+        """
+        Read the PDF printer's effective DEVMODE.
+        
+        Returns:
+            PyDEVMODE for the PDF printer, or None if it cannot be read
+        """
+        if not WIN32PRINT_AVAILABLE:
+            return None
+        
+        try:
+            handle = win32print.OpenPrinter(self.pdf_printer)
+            try:
+                devmode = win32print.GetPrinter(handle, 2)['pDevMode']
+                win32print.DocumentProperties(
+                    0, handle, self.pdf_printer, devmode, None, self.DM_OUT_BUFFER
+                )
+                return devmode
+            finally:
+                win32print.ClosePrinter(handle)
+        except Exception as e:
+            logger.debug(f"Could not read DEVMODE for '{self.pdf_printer}': {e}")
+            return None
+    
+    def _page_setup_matches(
+        self,
+        orientation: Optional[PageOrientation],
+        page_size: Optional[PageSize]
+    ) -> bool:
+        """
+        Check whether the printer already uses the requested page setup.
+        
+        Only consulted when trust_printer_defaults is set; the printer's
+        default DEVMODE is not P6's per-layout page setup.
+        
+        Args:
+            orientation: Requested orientation (None = don't care)
+            page_size: Requested paper size (None = don't care)
+            
+        Returns:
+            True if the Page Setup dialog can be skipped
+        """
+        if not self.trust_printer_defaults:
+            return False
+        
+        devmode = self._read_current_devmode()
+        if devmode is None:
+            return False
+        
+        if orientation and devmode.Orientation != self.DEVMODE_ORIENTATION[orientation]:
+            return False
+        if page_size and devmode.PaperSize != self.DEVMODE_PAPER_SIZE[page_size]:
+            return False
+        return True
+    
     # =========================================================================
     # Print to PDF
     # =========================================================================
@@ -378,18 +640,24 @@ class P6PrintManager:
         
         logger.info(f"Printing to PDF: {output_path}")
         
-        # Apply page setup if specified
-        if orientation or page_size:
+        # Apply page setup if specified and not already in effect
+        if (orientation or page_size) and self._page_setup_matches(orientation, page_size):
+            logger.debug("Page setup already matches; skipping Page Setup dialog")
+        elif orientation or page_size:
             self.open_page_setup()
-            if orientation:
-                self.set_page_orientation(orientation)
-            if page_size:
-                self.set_page_size(page_size)
-            self.apply_page_setup()
+            try:
+                if orientation:
+                    self.set_page_orientation(orientation)
+                if page_size:
+                    self.set_page_size(page_size)
+                self.apply_page_setup()
+            finally:
+                # Never carry cached elements past this dialog's lifetime
+                self._release_page_setup_dialog()
         
         # Open print dialog
         self._window.set_focus()
-        time.sleep(self.ACTION_DELAY)
+        self._ensure_focused()
         
         # Ctrl+P to open print dialog
         self._window.type_keys("^P")
@@ -426,7 +694,7 @@ class P6PrintManager:
         print_button = print_dialog.child_window(
             title="Print",
             control_type="Button"
-        )
+        ).wrapper_object()
         print_button.click_input()
         logger.debug("Clicked Print button")
         time.sleep(self.DIALOG_TIMEOUT)
@@ -440,7 +708,7 @@ class P6PrintManager:
             printer_combo = dialog.child_window(
                 control_type="ComboBox",
                 found_index=0
-            )
+            ).wrapper_object()
             printer_combo.select(self.pdf_printer)
             logger.debug(f"Selected printer: {self.pdf_printer}")
             time.sleep(self.ACTION_DELAY)
@@ -461,7 +729,7 @@ class P6PrintManager:
         filename_edit = save_dialog.child_window(
             control_type="Edit",
             found_index=0
-        )
+        ).wrapper_object()
         filename_edit.set_text(str(output_path))
         logger.debug(f"Set filename: {output_path}")
         time.sleep(self.ACTION_DELAY)
@@ -470,16 +738,32 @@ class P6PrintManager:
         save_button = save_dialog.child_window(
             title="Save",
             control_type="Button"
-        )
+        ).wrapper_object()
         save_button.click_input()
         logger.debug("Clicked Save button")
     
     def _wait_for_pdf(self, output_path: Path, timeout: float = None) -> bool:
-        """Wait for PDF file to be created."""
+        """
+        Wait for PDF file to be fully written.
+        
+        The file is considered complete once it is non-empty and its size
+        has not changed since the previous poll, which also skips over the
+        zero-byte placeholder Print to PDF creates before writing.
+        """
         timeout = timeout or self.PRINT_TIMEOUT
+        last_size = [0]
+        
+        def pdf_complete() -> bool:
+            try:
+                size = output_path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            complete = size > 0 and size == last_size[0]
+            last_size[0] = size
+            return complete
         
         return wait_for_condition(
-            condition=lambda: output_path.exists() and output_path.stat().st_size > 0,
+            condition=pdf_complete,
             timeout=timeout,
             poll_interval=1.0,
             description=f"PDF creation: {output_path.name}"
@@ -9,29 +9,24 @@ Provides project navigation and management automation:
 - Multi-project handling
 """
 
+import itertools
+import queue
 import time
-import re
-from pathlib import Path
 from typing import Optional, List, Dict, Tuple
-from datetime import datetime
 
 try:
-    from pywinauto import Application, Desktop
-    from pywinauto.findwindows import ElementNotFoundError
+    from pywinauto import Application
     PYWINAUTO_AVAILABLE = True
 except ImportError:
     PYWINAUTO_AVAILABLE = False
 
 from src.utils import logger
-from .exceptions import (
-    P6ProjectNotFoundError,
-    P6TimeoutError,
-    P6WindowNotFoundError
-)
+from .exceptions import P6ProjectNotFoundError
 from .utils import (
-    retry,
-    wait_for_condition,
-    sanitize_filename
+    wait_for_name_change,
+    watch_windows_opened,
+    uia_desktop,
+    uia_find_all
 )
 
 
@@ -54,21 +49,61 @@ class P6ProjectManager:
     CLOSE_PROJECT_TITLE = "Close"
     PROJECT_TAB_PATTERN = "Projects"
     
+    # Window title parsing: "Primavera P6 ... - ProjectName" / "... - [ProjectName]"
+    _DASH_SPLIT = ' - '
+    
+    SAVE_PROMPT_PATTERN = ".*Save.*|.*Changes.*"
+    
     # Timing
     DIALOG_TIMEOUT = 15
     ACTION_DELAY = 0.5
+    IDLE_CPU_THRESHOLD = 5  # Percent CPU below which P6 counts as idle
+    IDLE_SAMPLE_INTERVAL = 0.05
     OPEN_TIMEOUT = 30  # Large projects take time
+    SAVE_PROMPT_QUIET = 1.0  # Seconds without a new save prompt = done
+    TREE_CACHE_TTL = 5.0  # Seconds a project tree read stays valid
+    SNAPSHOT_TTL = 0.2  # Seconds a title/tab snapshot stays valid
+    INFO_CACHE_TTL = 2.0  # Seconds a get_project_info result stays valid
+    INFO_CACHE_SIZE = 64
     
-    def __init__(self, main_window):
+    def __init__(self, main_window, allow_magic_lookup: bool = False):
         """
         Initialize project manager.
         
         Args:
             main_window: P6 main window wrapper
+            allow_magic_lookup: Keep pywinauto attribute-style (best_match)
+                lookups enabled on the owning Application. Disabled by
+                default because the tree/tab readers here never use them.
         """
         self._window = main_window
+        
+        app = getattr(main_window, 'app', None)
+        if app is not None and hasattr(app, 'allow_magic_lookup'):
+            app.allow_magic_lookup = allow_magic_lookup
         self._current_project: Optional[str] = None
         
+        # Project tree cache (UIA tree walks are slow)
+        self._tree_cache: Optional[Dict[str, List[str]]] = None
+        self._project_index: Dict[str, str] = {}  # project name -> EPS name
+        self._tree_cache_ts: float = 0.0
+        self._tree_ttl: float = self.TREE_CACHE_TTL
+        
+        # Title/tab snapshot cache (see _snapshot)
+        self._snapshot_cache: Optional[Dict] = None
+        self._snapshot_ts: float = 0.0
+        
+        # get_project_info results: key -> (timestamp, info)
+        self._info_cache: Dict[str, Tuple[float, Dict]] = {}
+        
+        # Resolved control wrappers (see invalidate_controls)
+        self._tab_wrapper = None
+        self._tree_wrapper = None
+        self._win32_tab_wrapper = None
+        
+        # Logged once if _settle has to fall back to a fixed sleep
+        self._settle_fallback_logged = False
+        
         logger.debug("P6ProjectManager initialized")
     
     @property
@@ -79,12 +114,207 @@ class P6ProjectManager:
     @property
     def current_project(self) -> Optional[str]:
         """Get currently open project name."""
-        return self._current_project or self.get_current_project_from_title()
+        return self._current_project or self._snapshot()['current']
+    
+    def _settle(self):
+        """
+        Wait for P6 to go idle after an action.
+        
+        Returns as soon as P6's CPU usage drops and the main window is
+        ready. Both waits together never exceed ACTION_DELAY, the fixed
+        sleep this replaces.
+        """
+        app = getattr(self._window, 'app', None)
+        if app is None:
+            if not self._settle_fallback_logged:
+                logger.info("Main window has no .app; _settle falls back to a fixed sleep")
+                self._settle_fallback_logged = True
+            time.sleep(self.ACTION_DELAY)
+            return
+        
+        deadline = time.monotonic() + self.ACTION_DELAY
+        
+        try:
+            app.wait_cpu_usage_lower(
+                threshold=self.IDLE_CPU_THRESHOLD,
+                timeout=self.ACTION_DELAY,
+                usage_interval=self.IDLE_SAMPLE_INTERVAL
+            )
+        except Exception:
+            pass
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        
+        try:
+            self._window.wait('ready', timeout=remaining)
+        except Exception:
+            pass
+    
+    @property
+    def _tab_ctrl(self):
+        """Project Tab control wrapper, resolved once and reused."""
+        if self._tab_wrapper is None:
+            self._tab_wrapper = self._window.child_window(
+                control_type="Tab"
+            ).wrapper_object()
+        return self._tab_wrapper
+    
+    @property
+    def _tree_ctrl(self):
+        """Project Tree control wrapper, resolved once and reused."""
+        if self._tree_wrapper is None:
+            self._tree_wrapper = self._window.child_window(
+                control_type="Tree"
+            ).wrapper_object()
+        return self._tree_wrapper
+    
+    @property
+    def _win32_tab_ctrl(self):
+        """
+        Project Tab control via the win32 backend.
+        
+        Tab captions only need window messages (TCM_GETITEM), which the
+        win32 backend reads without UIA's per-element COM marshaling.
+        The control is resolved by the native handle of the UIA project
+        Tab control, so both backends always address the same control.
+        """
+        if self._win32_tab_wrapper is None:
+            tab_handle = self._tab_ctrl.handle
+            if not tab_handle:
+                raise RuntimeError("Project Tab control has no native window handle")
+            handle = self._window.handle
+            win32_window = Application(backend="win32").connect(
+                handle=handle
+            ).window(handle=handle)
+            self._win32_tab_wrapper = win32_window.child_window(
+                handle=tab_handle
+            ).wrapper_object()
+        return self._win32_tab_wrapper
+    
+    def invalidate_controls(self):
+        """Drop cached control wrappers (e.g. after the window changes)."""
+        self._tab_wrapper = None
+        self._tree_wrapper = None
+        self._win32_tab_wrapper = None
+    
+    def _read_tab_names(self, current: Optional[str] = None) -> List[str]:
+        """
+        Read all project tab captions, preferring the win32 backend.
+        
+        Args:
+            current: Project named in the window title, if any. A win32
+                read that lacks it is treated as suspect and re-read via UIA.
+        """
+        try:
+            tab_ctrl = self._win32_tab_ctrl
+            names = [tab_ctrl.get_tab_text(i) for i in range(tab_ctrl.tab_count())]
+            if current is None or current in names:
+                return names
+            logger.debug("win32 tabs %s lack current project %r, using UIA", names, current)
+        except Exception as e:
+            self._win32_tab_wrapper = None
+            logger.debug("win32 tab read failed, using UIA: %s", e)
+        
+        # Find project tabs in one UIA FindAll
+        tab_element = self._tab_ctrl.element_info.element
+        return [tab.CachedName for tab in uia_find_all(tab_element, "TabItem")]
+    
+    def _click_project_tab(self, project_name: str) -> bool:
+        """Click the tab for an open project, preferring the win32 backend."""
+        try:
+            tab_ctrl = self._win32_tab_ctrl
+            for index in range(tab_ctrl.tab_count()):
+                if tab_ctrl.get_tab_text(index) == project_name:
+                    tab_ctrl.click_input(
+                        coords=tab_ctrl.get_tab_rect(index).mid_point()
+                    )
+                    return True
+            logger.debug("win32 tabs lack %r, using UIA", project_name)
+        except Exception as e:
+            self._win32_tab_wrapper = None
+            logger.debug("win32 tab click failed, using UIA: %s", e)
+        
+        for tab in self._tab_ctrl.children():
+            if tab.window_text() == project_name:
+                tab.click_input()
+                return True
+        return False
+    
+    def invalidate_cache(self):
+        """Discard cached project tree and window state so the next read goes to P6."""
+        self._tree_cache = None
+        self._invalidate_window_state()
+    
+    def _invalidate_window_state(self):
+        """Discard cached title/tab snapshots and project info, keeping the tree."""
+        self._snapshot_cache = None
+        self._info_cache.clear()
+    
+    def _snapshot(self) -> Dict:
+        """
+        Read window title and open project tabs in one pass.
+        
+        Back-to-back queries (current project, open projects, project
+        info) share one snapshot for SNAPSHOT_TTL seconds instead of
+        each going back to P6.
+        
+        Returns:
+            Dict with 'title', 'open' (tab names in tab order),
+            'open_set' (frozenset of tab names for membership tests) and
+            'current' (project parsed from the title)
+        """
+        now = time.monotonic()
+        if (
+            self._snapshot_cache is not None
+            and now - self._snapshot_ts < self.SNAPSHOT_TTL
+        ):
+            return self._snapshot_cache
+        
+        title = ''
+        current = None
+        open_projects = []
+        
+        try:
+            title = self._window.window_text()
+            current = self._parse_project_from_title(title)
+            
+            for name in self._read_tab_names(current):
+                if name and name != "Projects":
+                    open_projects.append(name)
+                    
+        except Exception as e:
+            self.invalidate_controls()
+            logger.debug("Error getting open projects: %s", e)
+        
+        self._snapshot_cache = {
+            'title': title,
+            'open': open_projects,
+            'open_set': frozenset(open_projects),
+            'current': current
+        }
+        self._snapshot_ts = now
+        return self._snapshot_cache
     
     # =========================================================================
     # Project Discovery
     # =========================================================================
     
+    def _cached_tree(self) -> Optional[Dict[str, List[str]]]:
+        """Return the cached project tree if it is still within its TTL."""
+        if (
+            self._tree_cache is not None
+            and time.monotonic() - self._tree_cache_ts < self._tree_ttl
+        ):
+            return self._tree_cache
+        return None
+    
+    @staticmethod
+    def _flatten_tree(tree: Dict[str, List[str]]) -> List[str]:
+        """Flatten an EPS -> projects mapping into one project list."""
+        return list(itertools.chain.from_iterable(tree.values()))
+    
     def get_project_tree(self) -> Dict[str, List[str]]:
         """
         Get the project tree (EPS hierarchy).
@@ -94,42 +324,55 @@ class P6ProjectManager:
             
         Note:
             This requires navigating to Projects view and reading the tree.
+            Results are cached for TREE_CACHE_TTL seconds; closing
+            projects invalidates the cache (opening one does not).
         """
+        cached = self._cached_tree()
+        if cached is not None:
+            return cached
+        
         logger.info("Reading project tree...")
         
         tree = {}
+        project_index = {}
+        project_count = 0
         
         try:
             # Switch to Projects view
             self._switch_to_projects_view()
-            time.sleep(self.ACTION_DELAY)
+            self._settle()
             
-            # Find tree control
-            tree_control = self._window.child_window(
-                control_type="Tree"
-            )
+            # Get root items (EPS nodes) in one UIA FindAll
+            tree_element = self._tree_ctrl.element_info.element
             
-            if tree_control.exists():
-                # Get root items (EPS nodes)
-                roots = tree_control.roots()
+            for root in uia_find_all(tree_element, "TreeItem"):
+                eps_name = root.CachedName
                 
-                for root in roots:
-                    eps_name = root.window_text()
-                    projects = []
-                    
-                    # Get child items (projects)
-                    for child in root.children():
-                        project_name = child.window_text()
-                        if project_name:
-                            projects.append(project_name)
-                    
-                    if eps_name:
-                        tree[eps_name] = projects
+                # Get project items: leaves anywhere below this EPS, so
+                # sub-EPS nodes are not reported as projects
+                projects = [
+                    child.CachedName
+                    for child in uia_find_all(
+                        root, "TreeItem", descendants=True, leaves_only=True
+                    )
+                    if child.CachedName
+                ]
+                
+                if eps_name:
+                    tree[eps_name] = projects
+                    project_count += len(projects)
+                    for project in projects:
+                        project_index[project] = eps_name
+            
+            logger.info("✓ Found %s projects in %s EPS nodes", project_count, len(tree))
             
-            logger.info(f"✓ Found {sum(len(p) for p in tree.values())} projects in {len(tree)} EPS nodes")
+            self._tree_cache = tree
+            self._project_index = project_index
+            self._tree_cache_ts = time.monotonic()
             
         except Exception as e:
-            logger.error(f"Failed to read project tree: {e}")
+            self.invalidate_controls()
+            logger.error("Failed to read project tree: %s", e)
         
         return tree
     
@@ -139,12 +382,38 @@ class P6ProjectManager:
         
         Returns:
             List of project names
+            
+        Note:
+            Reads every leaf tree item below the EPS roots with one
+            descendant FindAll instead of walking each EPS node; this is
+            the same set get_project_tree() reports. Use get_project_tree()
+            when the EPS grouping is needed.
         """
-        tree = self.get_project_tree()
-        projects = []
-        for eps_projects in tree.values():
-            projects.extend(eps_projects)
-        return projects
+        cached = self._cached_tree()
+        if cached is not None:
+            return self._flatten_tree(cached)
+        
+        try:
+            self._switch_to_projects_view()
+            self._settle()
+            
+            tree_element = self._tree_ctrl.element_info.element
+            eps_names = {
+                root.CachedName for root in uia_find_all(tree_element, "TreeItem")
+            }
+            return [
+                item.CachedName
+                for item in uia_find_all(
+                    tree_element, "TreeItem", descendants=True, leaves_only=True
+                )
+                if item.CachedName and item.CachedName not in eps_names
+            ]
+            
+        except Exception as e:
+            self.invalidate_controls()
+            logger.debug("Flat project read failed, reading full tree: %s", e)
+        
+        return self._flatten_tree(self.get_project_tree())
     
     def get_open_projects(self) -> List[str]:
         """
@@ -153,24 +422,7 @@ class P6ProjectManager:
         Returns:
             List of open project names (from tabs)
         """
-        open_projects = []
-        
-        try:
-            # Find project tabs
-            tab_control = self._window.child_window(
-                control_type="Tab"
-            )
-            
-            if tab_control.exists():
-                for tab in tab_control.children():
-                    name = tab.window_text()
-                    if name and name != "Projects":
-                        open_projects.append(name)
-                        
-        except Exception as e:
-            logger.debug(f"Error getting open projects: {e}")
-        
-        return open_projects
+        return list(self._snapshot()['open'])
     
     def _switch_to_projects_view(self):
         """Switch to Projects navigation view."""
@@ -182,7 +434,7 @@ class P6ProjectManager:
             )
             if tab.exists():
                 tab.click_input()
-                time.sleep(self.ACTION_DELAY)
+                self._settle()
                 return
         except Exception:
             pass
@@ -190,7 +442,7 @@ class P6ProjectManager:
         # Try menu: View -> Projects
         try:
             self._window.menu_select("View->Projects")
-            time.sleep(self.ACTION_DELAY)
+            self._settle()
         except Exception:
             pass
     
@@ -215,16 +467,15 @@ class P6ProjectManager:
         if not project_name or not project_name.strip():
             raise ValueError("project_name cannot be empty")
         
-        logger.info(f"Opening project: {project_name}")
+        logger.info("Opening project: %s", project_name)
         
         try:
             self._window.set_focus()
-            time.sleep(self.ACTION_DELAY)
+            self._settle()
             
             # Check if already open
-            open_projects = self.get_open_projects()
-            if project_name in open_projects:
-                logger.info(f"Project already open, switching to: {project_name}")
+            if project_name in self._snapshot()['open_set']:
+                logger.info("Project already open, switching to: %s", project_name)
                 return self.switch_to_project(project_name)
             
             # Switch to projects view
@@ -234,12 +485,13 @@ class P6ProjectManager:
             if self._select_project_in_tree(project_name):
                 # Double-click to open
                 self._window.type_keys("{ENTER}")
-                time.sleep(self.OPEN_TIMEOUT / 3)
                 
                 # Wait for project to open
                 if self._wait_for_project_open(project_name):
                     self._current_project = project_name
-                    logger.info(f"✓ Project opened: {project_name}")
+                    # Opening a project changes tabs and title, not the tree
+                    self._invalidate_window_state()
+                    logger.info("✓ Project opened: %s", project_name)
                     return True
             
             raise P6ProjectNotFoundError(f"Project not found: {project_name}")
@@ -251,30 +503,38 @@ class P6ProjectManager:
     
     def _select_project_in_tree(self, project_name: str) -> bool:
         """Select a project in the tree control."""
+        # Direct lookup by EPS path, only if an earlier tree read indexed the
+        # project; never read the tree just for this (Ctrl+F is cheaper)
+        try:
+            eps_name = self._project_index.get(project_name)
+            if eps_name:
+                self._tree_ctrl.get_item([eps_name, project_name]).click_input()
+                return True
+        except Exception as e:
+            logger.debug("Direct tree lookup failed, using Find dialog: %s", e)
+        
         try:
-            tree = self._window.child_window(control_type="Tree")
-            
             # Use Ctrl+F to find
             self._window.type_keys("^F")
-            time.sleep(self.ACTION_DELAY)
+            self._settle()
             
             # Type project name
-            find_dialog = Desktop(backend="uia").window(title_re=".*Find.*")
+            find_dialog = uia_desktop().window(title_re=".*Find.*")
             if find_dialog.exists():
                 find_dialog.child_window(control_type="Edit").set_text(project_name)
                 find_dialog.child_window(title="Find Next", control_type="Button").click_input()
-                time.sleep(self.ACTION_DELAY)
+                self._settle()
                 find_dialog.type_keys("{ESC}")
                 return True
             
             # Fallback: try to select directly
-            item = tree.get_item([project_name])
+            item = self._tree_ctrl.get_item([project_name])
             if item:
                 item.click_input()
                 return True
                 
         except Exception as e:
-            logger.debug(f"Tree selection error: {e}")
+            logger.debug("Tree selection error: %s", e)
         
         return False
     
@@ -282,12 +542,14 @@ class P6ProjectManager:
         """Wait for project to finish opening."""
         timeout = timeout or self.OPEN_TIMEOUT
         
-        def is_project_open():
-            title = self._window.window_text()
-            return project_name.lower() in title.lower()
+        needle = project_name.lower()
+        
+        def is_project_open(title: str) -> bool:
+            return needle in title.lower()
         
-        return wait_for_condition(
-            condition=is_project_open,
+        return wait_for_name_change(
+            self._window,
+            predicate=is_project_open,
             timeout=timeout,
             description=f"Project open: {project_name}"
         )
@@ -302,34 +564,36 @@ class P6ProjectManager:
         Returns:
             True if closed successfully
         """
-        project_name = project_name or self.current_project
+        current = self.current_project
+        project_name = project_name or current
         
         if not project_name:
             logger.warning("No project to close")
             return False
         
-        logger.info(f"Closing project: {project_name}")
+        logger.info("Closing project: %s", project_name)
         
         try:
             # Switch to project first
-            if project_name != self.current_project:
+            if project_name != current:
                 self.switch_to_project(project_name)
             
             # File -> Close
             self._window.menu_select("File->Close")
-            time.sleep(self.ACTION_DELAY)
+            self._settle()
             
             # Handle save prompt if any
             self._handle_save_prompt(save=False)
             
             if self._current_project == project_name:
                 self._current_project = None
+            self.invalidate_cache()
             
-            logger.info(f"✓ Project closed: {project_name}")
+            logger.info("✓ Project closed: %s", project_name)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to close project: {e}")
+            logger.error("Failed to close project: %s", e)
             return False
     
     def close_all_projects(self) -> bool:
@@ -342,33 +606,65 @@ class P6ProjectManager:
         logger.info("Closing all projects...")
         
         try:
-            self._window.menu_select("File->Close All")
-            time.sleep(self.ACTION_DELAY)
-            
-            # Handle any save prompts
-            self._handle_save_prompt(save=False)
+            with watch_windows_opened(self.SAVE_PROMPT_PATTERN) as opened:
+                self._window.menu_select("File->Close All")
+                self._settle()
+                
+                # Handle any save prompts
+                self._handle_save_prompt(save=False)
+                if opened is not None:
+                    self._drain_save_prompts(opened, save=False)
             
             self._current_project = None
+            self.invalidate_cache()
             logger.info("✓ All projects closed")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to close all projects: {e}")
+            logger.error("Failed to close all projects: %s", e)
             return False
     
-    def _handle_save_prompt(self, save: bool = False):
+    def _drain_save_prompts(self, opened: "queue.Queue", save: bool = False):
+        """
+        Answer save prompts as they open, one per closing project.
+        
+        Stops once no new prompt has appeared for SAVE_PROMPT_QUIET
+        seconds, or after DIALOG_TIMEOUT overall.
+        
+        Args:
+            opened: Queue of window handles from watch_windows_opened
+            save: Answer Yes (save) instead of No
+        """
+        deadline = time.monotonic() + self.DIALOG_TIMEOUT
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                handle = opened.get(timeout=min(self.SAVE_PROMPT_QUIET, remaining))
+            except queue.Empty:
+                break
+            self._handle_save_prompt(
+                save=save,
+                dialog=uia_desktop().window(handle=handle)
+            )
+    
+    def _handle_save_prompt(self, save: bool = False, dialog=None):
         """Handle save changes prompt."""
         try:
-            save_dialog = Desktop(backend="uia").window(
-                title_re=".*Save.*|.*Changes.*"
-            )
+            save_dialog = dialog
+            if save_dialog is None:
+                save_dialog = uia_desktop().window(
+                    title_re=self.SAVE_PROMPT_PATTERN
+                )
             
             if save_dialog.exists():
                 if save:
                     save_dialog.child_window(title="Yes", control_type="Button").click_input()
                 else:
                     save_dialog.child_window(title="No", control_type="Button").click_input()
-                time.sleep(self.ACTION_DELAY)
+                self._settle()
                 
         except Exception:
             pass
@@ -387,25 +683,24 @@ class P6ProjectManager:
         Returns:
             True if switched successfully
         """
-        logger.debug(f"Switching to project: {project_name}")
+        logger.debug("Switching to project: %s", project_name)
         
         try:
             # Find and click project tab
-            tab_control = self._window.child_window(control_type="Tab")
-            
-            for tab in tab_control.children():
-                if tab.window_text() == project_name:
-                    tab.click_input()
-                    time.sleep(self.ACTION_DELAY)
-                    self._current_project = project_name
-                    logger.info(f"✓ Switched to: {project_name}")
-                    return True
+            if self._click_project_tab(project_name):
+                self._snapshot_cache = None
+                self._info_cache.clear()
+                self._settle()
+                self._current_project = project_name
+                logger.info("✓ Switched to: %s", project_name)
+                return True
             
-            logger.warning(f"Project tab not found: {project_name}")
+            logger.warning("Project tab not found: %s", project_name)
             return False
             
         except Exception as e:
-            logger.error(f"Failed to switch project: {e}")
+            self.invalidate_controls()
+            logger.error("Failed to switch project: %s", e)
             return False
     
     def get_current_project_from_title(self) -> Optional[str]:
@@ -415,20 +710,25 @@ class P6ProjectManager:
         Returns:
             Project name or None
         """
-        title = self._window.window_text()
+        return self._parse_project_from_title(self._window.window_text())
+    
+    @classmethod
+    def _parse_project_from_title(cls, title: str) -> Optional[str]:
+        """
+        Parse the project name out of a P6 window title.
         
-        # Pattern: "Primavera P6 ... - ProjectName"
-        match = re.search(r'-\s*\[?([^\[\]-]+)\]?\s*$', title)
-        if match:
-            return match.group(1).strip()
+        Handles "Primavera P6 ... - ProjectName" and
+        "Primavera P6 ... - [ProjectName]" with plain string slicing.
+        """
+        idx = title.rfind(cls._DASH_SPLIT)
+        if idx == -1:
+            return None
         
-        # Alternative: anything after last dash
-        if ' - ' in title:
-            parts = title.split(' - ')
-            if len(parts) > 1:
-                return parts[-1].strip()
+        tail = title[idx + len(cls._DASH_SPLIT):].strip()
+        if tail.startswith('[') and tail.endswith(']'):
+            tail = tail[1:-1].strip()
         
-        return None
+        return tail or None
     
     # =========================================================================
     # Project Info
@@ -443,15 +743,32 @@ class P6ProjectManager:
             
         Returns:
             Dict with project information
+            
+        Note:
+            Results are cached per project for INFO_CACHE_TTL seconds;
+            opening, closing or switching projects clears the cache.
         """
-        project_name = project_name or self.current_project
+        key = project_name or '__current__'
+        now = time.monotonic()
+        
+        cached = self._info_cache.get(key)
+        if cached is not None and now - cached[0] < self.INFO_CACHE_TTL:
+            return dict(cached[1])
+        
+        snapshot = self._snapshot()
+        current = self._current_project or snapshot['current']
+        project_name = project_name or current
         
         info = {
             'name': project_name,
-            'is_open': project_name in self.get_open_projects(),
-            'is_current': project_name == self.current_project
+            'is_open': project_name in snapshot['open_set'],
+            'is_current': project_name == current
         }
         
         # TODO: Read more info from project properties
         
-        return info
+        if len(self._info_cache) >= self.INFO_CACHE_SIZE:
+            self._info_cache.pop(next(iter(self._info_cache)))
+        self._info_cache[key] = (now, info)
+        
+        return dict(info)
@@ -9,19 +9,23 @@ Provides schedule calculation and resource management automation:
 - Baseline management
 """
 
+import re
 import time
+from contextlib import contextmanager
+from functools import wraps
 from pathlib import Path
 from typing import Optional, List, Dict
-from datetime import datetime
 from enum import Enum
 
 try:
-    from pywinauto import Desktop
+    from pywinauto import handleprops
     from pywinauto.findwindows import ElementNotFoundError
+    from pywinauto.timings import Timings, TimeoutError as UITimeoutError
     PYWINAUTO_AVAILABLE = True
 except ImportError:
     PYWINAUTO_AVAILABLE = False
 
+from src.config import P6_FAST_TIMINGS
 from src.utils import logger
 from .exceptions import (
     P6ScheduleError,
@@ -30,9 +34,55 @@ from .exceptions import (
 )
 from .utils import (
     wait_for_condition,
-    get_timestamp
+    get_timestamp,
+    uia_desktop
 )
 
+# Poll interval used while waiting for dialogs and controls to settle
+_DIALOG_POLL = 0.05
+
+
+def _noop(*_args):
+    """Safe mode check used when safe mode is off."""
+
+
+# pywinauto timings overridden while a manager with fast_timings runs
+_FAST_TIMINGS = {
+    'after_click_wait': 0.0,
+    'after_setfocus_wait': 0.0,
+    'window_find_timeout': 5,
+}
+
+
+@contextmanager
+def _fast_timings():
+    """
+    Temporarily shorten pywinauto's global waits.
+    
+    Every click_input/set_focus otherwise pays a fixed post-action wait.
+    The previous values are restored on exit, so other pywinauto users
+    in the process are unaffected outside the operation.
+    """
+    saved = {name: getattr(Timings, name) for name in _FAST_TIMINGS}
+    try:
+        for name, value in _FAST_TIMINGS.items():
+            setattr(Timings, name, value)
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(Timings, name, value)
+
+
+def _with_timings(method):
+    """Run a manager operation under _fast_timings() if the manager enables it."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.fast_timings:
+            return method(self, *args, **kwargs)
+        with _fast_timings():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class ScheduleOption(Enum):
     """Schedule calculation options."""
@@ -41,7 +91,76 @@ class ScheduleOption(Enum):
     ACTUAL_DATES = "Actual Dates"
 
 
-class P6ScheduleManager:
+class _DialogMixin:
+    """
+    Shared dialog handling for the schedule and baseline managers.
+    
+    Expects `self._window` (P6 main window) and `self._desktop` (cached UIA
+    Desktop root) to be set by the subclass, along with a
+    `_check_safe_mode_enabled(operation)` method.
+    """
+    
+    # Timing
+    DIALOG_TIMEOUT = 15
+    ACTION_DELAY = 0.5
+    
+    @property
+    def safe_mode(self) -> bool:
+        """Whether destructive operations are blocked."""
+        return self._safe_mode
+    
+    @safe_mode.setter
+    def safe_mode(self, value: bool):
+        # Bind the check once so the unblocked case costs nothing per call
+        self._safe_mode = value
+        self._check_safe_mode = self._check_safe_mode_enabled if value else _noop
+    
+    def _wait_dialog_ready(self, title_re: re.Pattern, timeout: float = None):
+        """
+        Wait for a top-level dialog to appear and become ready.
+        
+        Args:
+            title_re: Compiled title pattern of the dialog
+            timeout: Maximum wait time in seconds (default DIALOG_TIMEOUT)
+            
+        Returns:
+            Dialog window specification
+            
+        Raises:
+            P6TimeoutError: If the dialog does not appear within timeout
+        """
+        timeout = timeout or self.DIALOG_TIMEOUT
+        dialog = self._desktop.window(title_re=title_re)
+        if not wait_for_condition(
+            condition=lambda: dialog.exists(timeout=0),
+            timeout=timeout,
+            poll_interval=_DIALOG_POLL,
+            description=f"dialog '{title_re.pattern}'"
+        ):
+            raise P6TimeoutError(
+                f"Dialog not found ({title_re.pattern}) within {timeout}s"
+            )
+        dialog.wait("ready", timeout=timeout)
+        return dialog
+    
+    def _open_dialog(self, menu_path: str, title_re: re.Pattern, timeout: float = None):
+        """
+        Open a dialog from the main menu and wait for it to be ready.
+        
+        Args:
+            menu_path: Menu path, e.g. "Tools->Level Resources..."
+            title_re: Compiled title pattern of the dialog
+            timeout: Maximum wait time in seconds (default DIALOG_TIMEOUT)
+            
+        Returns:
+            Dialog window specification
+        """
+        self._window.set_focus()
+        self._window.menu_select(menu_path)
+        return self._wait_dialog_ready(title_re, timeout)
+
+
+class P6ScheduleManager(_DialogMixin):
     """
     Manages P6 scheduling and CPM operations.
     
@@ -62,25 +181,50 @@ class P6ScheduleManager:
     CHECK_SCHEDULE_TITLE = "Check Schedule"
     PROGRESS_DIALOG_TITLE = "Schedule Options"
     
+    # Compiled title patterns (pywinauto accepts these for title_re)
+    _RE_SCHEDULE_DIALOG = re.compile(f".*{SCHEDULE_DIALOG_TITLE}.*")
+    _RE_LEVEL_RESOURCES = re.compile(f".*{LEVEL_RESOURCES_TITLE}.*")
+    _RE_CHECK_SCHEDULE = re.compile(f".*{CHECK_SCHEDULE_TITLE}.*")
+    _RE_GLOBAL_CHANGE = re.compile(r".*Global Change.*")
+    _RE_PROGRESS = re.compile(r".*Progress.*|.*Scheduling.*|.*Please Wait.*")
+    _RE_SCHEDULE_BUTTON = re.compile(r".*Schedule.*|.*OK.*")
+    _RE_LEVEL_BUTTON = re.compile(r".*Level.*|.*OK.*")
+    _RE_CHECK_BUTTON = re.compile(r".*Check.*|.*Run.*")
+    _RE_CLOSE_BUTTON = re.compile(r".*Close.*|.*OK.*")
+    _RE_APPLY_BUTTON = re.compile(r".*Apply.*|.*Run.*")
+    _RE_SCHEDULE_OPTION = {
+        opt: re.compile(f".*{opt.value}.*") for opt in ScheduleOption
+    }
+    
     # Timing
-    DIALOG_TIMEOUT = 15
     SCHEDULE_TIMEOUT = 300  # 5 minutes for large projects
-    ACTION_DELAY = 0.5
+    PROGRESS_APPEAR_TIMEOUT = 2.0
+    PROGRESS_APPEAR_POLL = 0.1
+    PROGRESS_CLOSE_POLL = 0.25
     
-    def __init__(self, main_window, safe_mode: bool = True):
+    def __init__(
+        self,
+        main_window,
+        safe_mode: bool = True,
+        fast_timings: Optional[bool] = None
+    ):
         """
         Initialize schedule manager.
         
         Args:
             main_window: P6 main window wrapper
             safe_mode: Prevent destructive operations
+            fast_timings: Shorten pywinauto waits during operations
+                (default P6_FAST_TIMINGS)
         """
         self._window = main_window
         self.safe_mode = safe_mode
+        self.fast_timings = P6_FAST_TIMINGS if fast_timings is None else fast_timings
+        self._desktop = uia_desktop()
         
         logger.debug(f"P6ScheduleManager initialized (safe_mode={safe_mode})")
     
-    def _check_safe_mode(self, operation: str):
+    def _check_safe_mode_enabled(self, operation: str):
         """Check if operation is blocked by safe mode."""
         if self.safe_mode:
             raise P6SafeModeError(
@@ -92,6 +236,7 @@ class P6ScheduleManager:
     # Schedule Project (F9)
     # =========================================================================
     
+    @_with_timings
     def schedule_project(
         self,
         option: ScheduleOption = ScheduleOption.RETAINED_LOGIC,
@@ -114,21 +259,14 @@ class P6ScheduleManager:
         self._check_safe_mode("Schedule Project")
         
         logger.info(f"Scheduling project with option: {option.value}")
-        start_time = datetime.now()
+        start_time = time.monotonic()
         
         try:
             self._window.set_focus()
-            time.sleep(self.ACTION_DELAY)
             
             # Press F9 to open schedule dialog
             self._window.type_keys("{F9}")
-            time.sleep(self.ACTION_DELAY * 2)
-            
-            # Find schedule dialog
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.SCHEDULE_DIALOG_TITLE}.*"
-            )
-            dialog.wait("ready", timeout=self.DIALOG_TIMEOUT)
+            dialog = self._wait_dialog_ready(self._RE_SCHEDULE_DIALOG)
             logger.debug("Schedule dialog opened")
             
             # Select scheduling option
@@ -136,7 +274,7 @@ class P6ScheduleManager:
             
             # Click Schedule button
             schedule_button = dialog.child_window(
-                title_re=".*Schedule.*|.*OK.*",
+                title_re=self._RE_SCHEDULE_BUTTON,
                 control_type="Button"
             )
             schedule_button.click_input()
@@ -145,7 +283,7 @@ class P6ScheduleManager:
             if wait_for_completion:
                 # Wait for scheduling to complete
                 if self._wait_for_schedule_complete():
-                    elapsed = (datetime.now() - start_time).total_seconds()
+                    elapsed = time.monotonic() - start_time
                     logger.info(f"✓ Schedule complete in {elapsed:.1f}s")
                     return True
                 else:
@@ -162,38 +300,79 @@ class P6ScheduleManager:
         """Select scheduling option in dialog."""
         try:
             radio = dialog.child_window(
-                title_re=f".*{option.value}.*",
+                title_re=self._RE_SCHEDULE_OPTION[option],
                 control_type="RadioButton"
             )
             if radio.exists():
                 radio.click_input()
-                time.sleep(self.ACTION_DELAY)
+                wait_for_condition(
+                    condition=radio.is_selected,
+                    timeout=self.ACTION_DELAY,
+                    poll_interval=_DIALOG_POLL,
+                    description="schedule option selected"
+                )
         except Exception as e:
             logger.debug(f"Could not select schedule option: {e}")
     
     def _wait_for_schedule_complete(self, timeout: float = None) -> bool:
-        """Wait for schedule calculation to complete."""
+        """
+        Wait for schedule calculation to complete.
+        
+        Watches briefly for the progress dialog to appear, then waits for
+        it to close. Schedules that finish before the dialog is ever seen
+        return as soon as the appear window has elapsed. Once found, the
+        dialog is resolved a single time and its window handle is polled.
+        """
         timeout = timeout or self.SCHEDULE_TIMEOUT
+        start = time.monotonic()
+        
+        progress = self._desktop.window(
+            title_re=self._RE_PROGRESS
+        )
         
-        def is_complete():
-            # Check if progress dialog is gone
+        def progress_visible():
             try:
-                progress = Desktop(backend="uia").window(
-                    title_re=".*Progress.*|.*Scheduling.*|.*Please Wait.*"
-                )
-                return not progress.exists()
+                return progress.exists(timeout=0)
             except Exception:
+                return False
+        
+        # Fast poll for the progress dialog to appear
+        appear_deadline = start + min(self.PROGRESS_APPEAR_TIMEOUT, timeout)
+        while not progress_visible():
+            if time.monotonic() >= appear_deadline:
+                logger.debug("No progress dialog seen, schedule already complete")
                 return True
+            time.sleep(self.PROGRESS_APPEAR_POLL)
         
-        # Initial wait for progress dialog to appear
-        time.sleep(2)
+        # Progress dialog is up; resolve it once and watch its native handle
+        # rather than re-searching the UIA tree on every poll
+        try:
+            handle = progress.wrapper_object().handle
+        except ElementNotFoundError:
+            logger.debug("Progress dialog already closed")
+            return True
         
-        return wait_for_condition(
-            condition=is_complete,
-            timeout=timeout,
-            poll_interval=2.0,
-            description="Schedule completion"
-        )
+        remaining = max(0.0, timeout - (time.monotonic() - start))
+        if handle:
+            return wait_for_condition(
+                condition=lambda: not handleprops.iswindow(handle),
+                timeout=remaining,
+                poll_interval=self.PROGRESS_CLOSE_POLL,
+                description="Schedule completion"
+            )
+        
+        try:
+            progress.wait_not(
+                "exists",
+                timeout=remaining,
+                retry_interval=self.PROGRESS_CLOSE_POLL
+            )
+        except UITimeoutError:
+            logger.warning(f"Timeout waiting for Schedule completion after {timeout}s")
+            return False
+        
+        logger.debug(f"Schedule completion satisfied in {time.monotonic() - start:.1f}s")
+        return True
     
     def schedule_f9(self) -> bool:
         """Quick F9 schedule with default options."""
@@ -203,6 +382,7 @@ class P6ScheduleManager:
     # Resource Leveling
     # =========================================================================
     
+    @_with_timings
     def level_resources(
         self,
         priority_based: bool = True,
@@ -223,21 +403,15 @@ class P6ScheduleManager:
         logger.info("Running resource leveling...")
         
         try:
-            self._window.set_focus()
-            time.sleep(self.ACTION_DELAY)
-            
             # Tools -> Level Resources (or Project -> Level Resources)
-            self._window.menu_select("Tools->Level Resources...")
-            time.sleep(self.ACTION_DELAY * 2)
-            
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.LEVEL_RESOURCES_TITLE}.*"
+            dialog = self._open_dialog(
+                "Tools->Level Resources...",
+                self._RE_LEVEL_RESOURCES
             )
-            dialog.wait("ready", timeout=self.DIALOG_TIMEOUT)
             
             # Click Level button
             level_button = dialog.child_window(
-                title_re=".*Level.*|.*OK.*",
+                title_re=self._RE_LEVEL_BUTTON,
                 control_type="Button"
             )
             level_button.click_input()
@@ -257,6 +431,7 @@ class P6ScheduleManager:
     # Schedule Check
     # =========================================================================
     
+    @_with_timings
     def check_schedule(self) -> Dict:
         """
         Run schedule check (diagnostics).
@@ -273,53 +448,95 @@ class P6ScheduleManager:
             'errors': []
         }
         
+        dialog = None
         try:
-            self._window.set_focus()
-            time.sleep(self.ACTION_DELAY)
-            
             # Tools -> Check Schedule
-            self._window.menu_select("Tools->Check Schedule...")
-            time.sleep(self.ACTION_DELAY * 2)
-            
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.CHECK_SCHEDULE_TITLE}.*"
+            dialog = self._open_dialog(
+                "Tools->Check Schedule...",
+                self._RE_CHECK_SCHEDULE
             )
-            dialog.wait("ready", timeout=self.DIALOG_TIMEOUT)
             
             # Click Check button
             check_button = dialog.child_window(
-                title_re=".*Check.*|.*Run.*",
+                title_re=self._RE_CHECK_BUTTON,
                 control_type="Button"
             )
             check_button.click_input()
-            time.sleep(self.ACTION_DELAY * 3)
-            
-            # Try to read results
             results['ran'] = True
             
-            # TODO: Parse results from dialog/output
-            # This requires reading the results pane
+            # Close is enabled from the moment the dialog opens, so it says
+            # nothing about the check. Instead wait briefly for the check to
+            # show as busy (progress window, disabled dialog or results), then
+            # for the dialog to go idle again. A clean check may never show
+            # results or progress, so going idle is enough.
+            results_grid = dialog.child_window(control_type="DataGrid")
+            progress = self._desktop.window(title_re=self._RE_PROGRESS)
+            
+            def has_results():
+                return (
+                    results_grid.exists(timeout=0)
+                    and results_grid.wrapper_object().item_count() > 0
+                )
             
-            # Close dialog
-            close_button = dialog.child_window(
-                title_re=".*Close.*|.*OK.*",
-                control_type="Button"
+            def check_busy():
+                return (
+                    has_results()
+                    or progress.exists(timeout=0)
+                    or not dialog.is_enabled()
+                )
+            
+            def check_idle():
+                return has_results() or (
+                    not progress.exists(timeout=0) and dialog.is_enabled()
+                )
+            
+            if not wait_for_condition(
+                condition=check_busy,
+                timeout=self.PROGRESS_APPEAR_TIMEOUT,
+                poll_interval=_DIALOG_POLL,
+                description="schedule check started"
+            ):
+                logger.debug("Schedule check not seen running, assuming it already finished")
+            
+            ready = wait_for_condition(
+                condition=check_idle,
+                timeout=self.DIALOG_TIMEOUT,
+                poll_interval=_DIALOG_POLL,
+                description="schedule check results"
             )
-            if close_button.exists():
-                close_button.click_input()
             
-            logger.info("✓ Schedule check complete")
+            # TODO: Parse results from dialog/output
+            # This requires reading the results pane
+            
+            if ready:
+                logger.info("✓ Schedule check complete")
+            else:
+                message = f"Schedule check still busy after {self.DIALOG_TIMEOUT}s"
+                logger.warning(message)
+                results['warnings'].append(message)
             
         except Exception as e:
             logger.error(f"Failed to check schedule: {e}")
             results['errors'].append(str(e))
         
+        finally:
+            # Always close the modal dialog so later automation is not blocked
+            if dialog is not None:
+                try:
+                    dialog.child_window(
+                        title_re=self._RE_CLOSE_BUTTON,
+                        control_type="Button"
+                    ).wrapper_object().click_input()
+                except Exception as e:
+                    logger.debug(f"Could not close Check Schedule dialog: {e}")
+        
         return results
     
     # =========================================================================
     # Global Change
     # =========================================================================
     
+    @_with_timings
     def run_global_change(self, change_name: str) -> bool:
         """
         Run a saved global change.
@@ -335,16 +552,11 @@ class P6ScheduleManager:
         logger.info(f"Running global change: {change_name}")
         
         try:
-            self._window.set_focus()
-            
             # Tools -> Global Change
-            self._window.menu_select("Tools->Global Change...")
-            time.sleep(self.ACTION_DELAY * 2)
-            
-            dialog = Desktop(backend="uia").window(
-                title_re=".*Global Change.*"
+            dialog = self._open_dialog(
+                "Tools->Global Change...",
+                self._RE_GLOBAL_CHANGE
             )
-            dialog.wait("ready", timeout=self.DIALOG_TIMEOUT)
             
             # Find and select change
             list_control = dialog.child_window(control_type="List")
@@ -355,11 +567,43 @@ class P6ScheduleManager:
             
             # Apply
             apply_button = dialog.child_window(
-                title_re=".*Apply.*|.*Run.*",
+                title_re=self._RE_APPLY_BUTTON,
                 control_type="Button"
             )
             apply_button.click_input()
-            time.sleep(self.ACTION_DELAY * 2)
+            
+            # The dialog is disabled (or a progress window shows) while the
+            # change runs. Right after the click it is still enabled, so first
+            # wait briefly for the run to start, then for it to finish.
+            progress = self._desktop.window(title_re=self._RE_PROGRESS)
+            
+            def dialog_idle():
+                return not dialog.exists(timeout=0) or dialog.is_enabled()
+            
+            def change_started():
+                # Disabled, closed, or showing progress all mean the click took
+                return (
+                    progress.exists(timeout=0)
+                    or not dialog.exists(timeout=0)
+                    or not dialog.is_enabled()
+                )
+            
+            if not wait_for_condition(
+                condition=change_started,
+                timeout=self.PROGRESS_APPEAR_TIMEOUT,
+                poll_interval=_DIALOG_POLL,
+                description="global change started"
+            ):
+                logger.debug("Global change not seen running, assuming it already finished")
+            
+            if not wait_for_condition(
+                condition=lambda: dialog_idle() and not progress.exists(timeout=0),
+                timeout=self.DIALOG_TIMEOUT,
+                poll_interval=_DIALOG_POLL,
+                description="global change applied"
+            ):
+                logger.error(f"Global change did not finish within {self.DIALOG_TIMEOUT}s: {change_name}")
+                return False
             
             logger.info(f"✓ Global change applied: {change_name}")
             return True
@@ -387,7 +631,7 @@ class P6ScheduleManager:
         }
 
 
-class P6BaselineManager:
+class P6BaselineManager(_DialogMixin):
     """
     Manages P6 baselines.
     
@@ -404,24 +648,34 @@ class P6BaselineManager:
     ASSIGN_BASELINE_TITLE = "Assign Baselines"
     MAINTAIN_BASELINE_TITLE = "Maintain Baselines"
     
-    # Timing
-    DIALOG_TIMEOUT = 15
-    ACTION_DELAY = 0.5
+    # Compiled title patterns (pywinauto accepts these for title_re)
+    _RE_ASSIGN_BASELINE = re.compile(f".*{ASSIGN_BASELINE_TITLE}.*")
+    _RE_MAINTAIN_BASELINE = re.compile(f".*{MAINTAIN_BASELINE_TITLE}.*")
+    _RE_ADD_BUTTON = re.compile(r".*Add.*|.*New.*")
     
-    def __init__(self, main_window, safe_mode: bool = True):
+    def __init__(
+        self,
+        main_window,
+        safe_mode: bool = True,
+        fast_timings: Optional[bool] = None
+    ):
         """
         Initialize baseline manager.
         
         Args:
             main_window: P6 main window wrapper
             safe_mode: Prevent destructive operations
+            fast_timings: Shorten pywinauto waits during operations
+                (default P6_FAST_TIMINGS)
         """
         self._window = main_window
         self.safe_mode = safe_mode
+        self.fast_timings = P6_FAST_TIMINGS if fast_timings is None else fast_timings
+        self._desktop = uia_desktop()
         
         logger.debug(f"P6BaselineManager initialized")
     
-    def _check_safe_mode(self, operation: str):
+    def _check_safe_mode_enabled(self, operation: str):
         """Check if operation is blocked by safe mode."""
         if self.safe_mode:
             raise P6SafeModeError(
@@ -429,6 +683,7 @@ class P6BaselineManager:
                 f"Set safe_mode=False to enable baseline operations."
             )
     
+    @_with_timings
     def create_baseline(self, baseline_name: str) -> bool:
         """
         Create a new baseline from current schedule.
@@ -447,31 +702,25 @@ class P6BaselineManager:
         logger.info(f"Creating baseline: {baseline_name}")
         
         try:
-            self._window.set_focus()
-            
             # Project -> Maintain Baselines
-            self._window.menu_select("Project->Maintain Baselines...")
-            time.sleep(self.ACTION_DELAY * 2)
-            
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.MAINTAIN_BASELINE_TITLE}.*"
+            dialog = self._open_dialog(
+                "Project->Maintain Baselines...",
+                self._RE_MAINTAIN_BASELINE
             )
-            dialog.wait("ready", timeout=self.DIALOG_TIMEOUT)
             
             # Click Add button
             add_button = dialog.child_window(
-                title_re=".*Add.*|.*New.*",
+                title_re=self._RE_ADD_BUTTON,
                 control_type="Button"
             )
             add_button.click_input()
-            time.sleep(self.ACTION_DELAY)
             
             # Enter name
             name_edit = dialog.child_window(
                 control_type="Edit",
                 found_index=0
             )
-            if name_edit.exists():
+            if name_edit.exists(timeout=self.ACTION_DELAY):
                 name_edit.set_text(baseline_name)
             
             # Save/OK
@@ -490,6 +739,7 @@ class P6BaselineManager:
             logger.error(f"Failed to create baseline: {e}")
             return False
     
+    @_with_timings
     def assign_baseline(
         self,
         baseline_name: str,
@@ -510,16 +760,11 @@ class P6BaselineManager:
         logger.info(f"Assigning baseline: {baseline_name} as {baseline_type}")
         
         try:
-            self._window.set_focus()
-            
             # Project -> Assign Baselines
-            self._window.menu_select("Project->Assign Baselines...")
-            time.sleep(self.ACTION_DELAY * 2)
-            
-            dialog = Desktop(backend="uia").window(
-                title_re=f".*{self.ASSIGN_BASELINE_TITLE}.*"
+            dialog = self._open_dialog(
+                "Project->Assign Baselines...",
+                self._RE_ASSIGN_BASELINE
             )
-            dialog.wait("ready", timeout=self.DIALOG_TIMEOUT)
             
             # Find baseline dropdown and select
             # TODO: Implement baseline selection in dialog
@@ -540,6 +785,7 @@ class P6BaselineManager:
             logger.error(f"Failed to assign baseline: {e}")
             return False
     
+    @_with_timings
     def open_maintain_baselines(self) -> bool:
         """
         Open the Maintain Baselines dialog.
@@ -548,9 +794,10 @@ class P6BaselineManager:
             True if opened successfully
         """
         try:
-            self._window.set_focus()
-            self._window.menu_select("Project->Maintain Baselines...")
-            time.sleep(self.ACTION_DELAY * 2)
+            self._open_dialog(
+                "Project->Maintain Baselines...",
+                self._RE_MAINTAIN_BASELINE
+            )
             return True
         except Exception as e:
             logger.error(f"Failed to open baseline dialog: {e}")
@@ -4,16 +4,25 @@ Utility functions for P6 GUI Automation.
 
 Provides:
 - Smart waiting functions
+- Bulk UIA element queries
 - Screenshot capture
 - Control identifier helpers
 - Retry mechanisms
 """
 
+import atexit
+import queue
+import random
+import re
+import string
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional, Any
-from functools import wraps
+from typing import Callable, Optional, Any, List
+from functools import wraps, lru_cache
 
 from src.utils import logger
 from src.config import PDF_OUTPUT_DIR
@@ -23,37 +32,53 @@ def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
     exceptions: tuple = (Exception,),
-    on_retry: Optional[Callable] = None
+    on_retry: Optional[Callable] = None,
+    max_delay: float = 5.0,
+    backoff: float = 2.0,
+    jitter: float = 0.1
 ):
     """
     Decorator to retry a function on failure.
     
+    Delays grow exponentially from `delay` and are capped at `max_delay`.
+    Each delay is randomized by +/- `jitter` (as a fraction).
+    
     Args:
         max_attempts: Maximum number of attempts
-        delay: Delay between attempts in seconds
+        delay: Delay before the first retry in seconds
         exceptions: Tuple of exceptions to catch
         on_retry: Optional callback on retry(attempt, exception)
+        max_delay: Upper bound on any single delay in seconds
+        backoff: Multiplier applied to the delay after each failure
+        jitter: Random fraction applied to each delay (0 disables)
     """
+    # Delay schedule is fixed per decoration; only jitter varies per call
+    delays = [min(delay * backoff ** i, max_delay) for i in range(max_attempts - 1)]
+    
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(1, max_attempts + 1):
+            for attempt, base_delay in enumerate(delays, 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts:
-                        logger.warning(
-                            f"Attempt {attempt}/{max_attempts} failed: {e}. "
-                            f"Retrying in {delay}s..."
-                        )
-                        if on_retry:
-                            on_retry(attempt, e)
-                        time.sleep(delay)
-                    else:
-                        logger.error(f"All {max_attempts} attempts failed: {e}")
-            raise last_exception
+                    sleep_for = base_delay
+                    if jitter:
+                        sleep_for *= 1 + random.uniform(-jitter, jitter)
+                    logger.warning(
+                        f"Attempt {attempt}/{max_attempts} failed: {e}. "
+                        f"Retrying in {sleep_for:.2f}s..."
+                    )
+                    if on_retry:
+                        on_retry(attempt, e)
+                    time.sleep(sleep_for)
+            
+            # Final attempt propagates its exception
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                logger.error(f"All {max_attempts} attempts failed: {e}")
+                raise
         return wrapper
     return decorator
 
@@ -67,6 +92,9 @@ def wait_for_condition(
     """
     Wait for a condition to become true.
     
+    The condition is checked immediately and then after each poll. Sleeps
+    never run past the deadline, and elapsed time uses the monotonic clock.
+    
     Args:
         condition: Callable that returns True when condition is met
         timeout: Maximum wait time in seconds
@@ -76,23 +104,183 @@ def wait_for_condition(
     Returns:
         True if condition was met, False if timeout
     """
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = start_time + timeout
     logger.debug(f"Waiting for {description} (timeout={timeout}s)")
     
-    while time.time() - start_time < timeout:
+    while True:
         try:
             if condition():
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 logger.debug(f"{description} satisfied in {elapsed:.1f}s")
                 return True
         except Exception as e:
             logger.debug(f"Condition check error: {e}")
-        time.sleep(poll_interval)
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(poll_interval, remaining))
     
     logger.warning(f"Timeout waiting for {description} after {timeout}s")
     return False
 
 
+def wait_for_name_change(
+    window,
+    predicate: Callable[[str], bool],
+    timeout: float = 30.0,
+    description: str = "name change"
+) -> bool:
+    """
+    Wait for a window's UIA Name (title) to satisfy a predicate.
+    
+    Subscribes to UIA Name property-change events and wakes up as soon as
+    a matching title is published, instead of polling window_text().
+    Falls back to wait_for_condition polling if the event handler cannot
+    be registered.
+    
+    Args:
+        window: pywinauto UIA window wrapper or specification
+        predicate: Callable taking the new title, True when satisfied
+        timeout: Maximum wait time in seconds
+        description: Description for logging
+        
+    Returns:
+        True if the predicate was satisfied, False if timeout
+    """
+    try:
+        import comtypes
+        from pywinauto.uia_defines import IUIA
+        
+        uia = IUIA()
+        element = window.element_info.element
+    except Exception as e:
+        logger.debug(f"UIA events unavailable ({e}); polling for {description}")
+        return wait_for_condition(
+            condition=lambda: predicate(window.window_text()),
+            timeout=timeout,
+            description=description
+        )
+    
+    done = threading.Event()
+    
+    class NameChangedHandler(comtypes.COMObject):
+        _com_interfaces_ = [uia.UIA_dll.IUIAutomationPropertyChangedEventHandler]
+        
+        def HandlePropertyChangedEvent(self, sender, property_id, new_value):
+            try:
+                if predicate(str(new_value)):
+                    done.set()
+            except Exception:
+                pass
+            return 0
+    
+    handler = NameChangedHandler()
+    try:
+        uia.iuia.AddPropertyChangedEventHandler(
+            element,
+            uia.UIA_dll.TreeScope_Element,
+            None,
+            handler,
+            [uia.UIA_dll.UIA_NamePropertyId]
+        )
+    except Exception as e:
+        logger.debug(f"Could not subscribe to Name changes ({e}); polling for {description}")
+        return wait_for_condition(
+            condition=lambda: predicate(window.window_text()),
+            timeout=timeout,
+            description=description
+        )
+    
+    start_time = time.monotonic()
+    logger.debug(f"Waiting for {description} (timeout={timeout}s, event-driven)")
+    try:
+        # The title may already match before the subscription became active
+        if predicate(window.window_text()):
+            done.set()
+        met = done.wait(timeout)
+    finally:
+        try:
+            uia.iuia.RemovePropertyChangedEventHandler(element, handler)
+        except Exception:
+            pass
+    
+    if met:
+        logger.debug(f"{description} satisfied in {time.monotonic() - start_time:.1f}s")
+    else:
+        logger.warning(f"Timeout waiting for {description} after {timeout}s")
+    return met
+
+
+@contextmanager
+def watch_windows_opened(title_re: str):
+    """
+    Collect windows opened while the ``with`` block runs.
+    
+    Subscribes to the UIA WindowOpened event across the desktop, so a
+    burst of dialogs (e.g. one save prompt per closing project) is seen
+    as it happens instead of by repeated desktop scans. Only the native
+    handle is queued; callers interact with the window on their own
+    thread.
+    
+    Args:
+        title_re: Regex the new window's title must match
+        
+    Yields:
+        queue.Queue of native window handles, or None if UIA events
+        are unavailable
+    """
+    pattern = re.compile(title_re)
+    opened = None
+    
+    try:
+        import comtypes
+        from pywinauto.uia_defines import IUIA
+        
+        uia = IUIA()
+        event_id = uia.UIA_dll.UIA_Window_WindowOpenedEventId
+        
+        class WindowOpenedHandler(comtypes.COMObject):
+            _com_interfaces_ = [uia.UIA_dll.IUIAutomationEventHandler]
+            
+            def HandleAutomationEvent(self, sender, event):
+                try:
+                    if pattern.match(sender.CurrentName or ""):
+                        opened.put(sender.CurrentNativeWindowHandle)
+                except Exception:
+                    pass
+                return 0
+        
+        handler = WindowOpenedHandler()
+        opened = queue.Queue()
+        uia.iuia.AddAutomationEventHandler(
+            event_id,
+            uia.root,
+            uia.UIA_dll.TreeScope_Subtree,
+            None,
+            handler
+        )
+    except Exception as e:
+        logger.debug(f"Could not subscribe to WindowOpened events: {e}")
+        opened = None
+    
+    try:
+        yield opened
+    finally:
+        if opened is not None:
+            try:
+                uia.iuia.RemoveAutomationEventHandler(event_id, uia.root, handler)
+            except Exception:
+                pass
+
+
+# Adaptive poll interval for wait_for_window
+WINDOW_POLL_MIN = 0.02
+WINDOW_POLL_MAX = 0.25
+WINDOW_POLL_BACKOFF = 1.5
+
+
 def wait_for_window(
     app,
     title: Optional[str] = None,
@@ -118,25 +306,32 @@ def wait_for_window(
     """
     from .exceptions import P6TimeoutError
     
-    start_time = time.time()
+    kwargs = {}
+    if title:
+        kwargs['title'] = title
+    if title_re:
+        kwargs['title_re'] = title_re
+    if control_type:
+        kwargs['control_type'] = control_type
+    
+    deadline = time.monotonic() + timeout
+    interval = WINDOW_POLL_MIN
     
-    while time.time() - start_time < timeout:
+    while True:
         try:
-            kwargs = {}
-            if title:
-                kwargs['title'] = title
-            if title_re:
-                kwargs['title_re'] = title_re
-            if control_type:
-                kwargs['control_type'] = control_type
-            
             window = app.window(**kwargs)
-            if window.exists():
+            if window.exists(timeout=0):
                 window.wait('ready', timeout=5)
                 return window
         except Exception:
             pass
-        time.sleep(0.5)
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Poll fast at first, backing off for windows that are slow to open
+        time.sleep(min(interval, remaining))
+        interval = min(interval * WINDOW_POLL_BACKOFF, WINDOW_POLL_MAX)
     
     # Build descriptive error message
     criteria = []
@@ -151,21 +346,116 @@ def wait_for_window(
     raise P6TimeoutError(f"Window not found ({criteria_str}) within {timeout}s")
 
 
+@lru_cache(maxsize=1)
+def uia_desktop():
+    """
+    Get the shared UIA Desktop root.
+    
+    Creating Desktop(backend="uia") re-initializes the UIA automation
+    root, so one instance is created per process and reused.
+    
+    Returns:
+        pywinauto Desktop (uia backend)
+    """
+    from pywinauto import Desktop
+    return Desktop(backend="uia")
+
+
+def uia_find_all(
+    element,
+    control_type: str,
+    descendants: bool = False,
+    leaves_only: bool = False
+) -> List[Any]:
+    """
+    Find UIA elements of one control type in a single FindAll call.
+    
+    The element Name is fetched through a cache request alongside the
+    search, so reading ``CachedName`` on the results costs no further
+    cross-process calls.
+    
+    Args:
+        element: Raw IUIAutomationElement to search under
+            (``wrapper.element_info.element``)
+        control_type: UIA control type name (e.g. "TreeItem")
+        descendants: Search the whole subtree instead of direct children
+        leaves_only: Keep only elements whose ExpandCollapse state is
+            LeafNode (tree items without children); the state is fetched
+            in the same cache request
+        
+    Returns:
+        List of IUIAutomationElement with Name cached
+    """
+    from pywinauto.uia_defines import IUIA
+    
+    uia = IUIA()
+    condition = uia.iuia.CreatePropertyCondition(
+        uia.UIA_dll.UIA_ControlTypePropertyId,
+        uia.known_control_types[control_type]
+    )
+    request = uia.iuia.CreateCacheRequest()
+    request.AddProperty(uia.UIA_dll.UIA_NamePropertyId)
+    state_id = uia.UIA_dll.UIA_ExpandCollapseExpandCollapseStatePropertyId
+    if leaves_only:
+        request.AddProperty(state_id)
+    scope = (
+        uia.UIA_dll.TreeScope_Descendants if descendants
+        else uia.UIA_dll.TreeScope_Children
+    )
+    
+    found = element.FindAllBuildCache(scope, condition, request)
+    if not found:
+        return []
+    elements = [found.GetElement(i) for i in range(found.Length)]
+    if leaves_only:
+        leaf = uia.UIA_dll.ExpandCollapseState_LeafNode
+        elements = [e for e in elements if e.GetCachedPropertyValue(state_id) == leaf]
+    return elements
+
+
+# Screenshots are PNG-encoded off the automation thread
+_SCREENSHOT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="p6-screenshot"
+)
+_pending_screenshots: List[Future] = []
+atexit.register(_SCREENSHOT_EXECUTOR.shutdown, wait=True)
+
+
+def _save_screenshot(image, output_path: Path):
+    """Encode and write a captured image (runs on the screenshot thread)."""
+    try:
+        image.save(str(output_path), optimize=False, compress_level=1)
+        logger.info(f"Screenshot saved: {output_path}")
+    except Exception as e:
+        logger.error(f"Failed to save screenshot {output_path}: {e}")
+        raise
+
+
 def capture_screenshot(
     window,
     filename: Optional[str] = None,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    wait: bool = False
 ) -> Path:
     """
     Capture a screenshot of a window.
     
+    The image is grabbed immediately; writing the PNG happens in the
+    background. Call flush_screenshots() before reading the file, or pass
+    wait=True to block until this file is written.
+    
     Args:
         window: pywinauto window wrapper
         filename: Optional filename (auto-generated if not provided)
         output_dir: Output directory (defaults to PDF_OUTPUT_DIR)
+        wait: Wait for the PNG to be written before returning
         
     Returns:
-        Path to saved screenshot
+        Path the screenshot is (or, with wait=True, has been) saved to
+        
+    Raises:
+        Exception: If capturing fails, or with wait=True if writing fails
     """
     output_dir = Path(output_dir or PDF_OUTPUT_DIR) / "screenshots"
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -181,31 +471,60 @@ def capture_screenshot(
     
     try:
         image = window.capture_as_image()
-        image.save(str(output_path))
-        logger.info(f"Screenshot saved: {output_path}")
-        return output_path
     except Exception as e:
         logger.error(f"Failed to capture screenshot: {e}")
         raise
+    
+    future = _SCREENSHOT_EXECUTOR.submit(_save_screenshot, image, output_path)
+    if wait:
+        future.result()
+        return output_path
+    
+    _pending_screenshots[:] = [f for f in _pending_screenshots if not f.done()]
+    _pending_screenshots.append(future)
+    return output_path
+
+
+def flush_screenshots(timeout: Optional[float] = None) -> bool:
+    """
+    Wait for queued screenshots to finish writing.
+    
+    Args:
+        timeout: Maximum wait time in seconds (None waits indefinitely)
+        
+    Returns:
+        True if all screenshots were written successfully
+    """
+    pending = list(_pending_screenshots)
+    _pending_screenshots.clear()
+    done, not_done = futures_wait(pending, timeout=timeout)
+    return not not_done and all(f.exception() is None for f in done)
+
+
+# Backoff between safe_click attempts (last value repeats)
+CLICK_RETRY_DELAYS = (0.2, 0.5)
 
 
 def safe_click(control, retry_count: int = 3):
     """
     Safely click a control with retry logic.
     
+    Waits once for the control to become visible, then retries only the
+    click itself with a short backoff.
+    
     Args:
         control: pywinauto control wrapper
         retry_count: Number of retries on failure
     """
+    control.wait('visible', timeout=5)
     for attempt in range(retry_count):
         try:
-            control.wait('visible', timeout=5)
             control.click_input()
             return
         except Exception as e:
             if attempt < retry_count - 1:
                 logger.warning(f"Click failed (attempt {attempt + 1}): {e}")
-                time.sleep(0.5)
+                time.sleep(CLICK_RETRY_DELAYS[min(attempt, len(CLICK_RETRY_DELAYS) - 1)])
             else:
                 raise
 
@@ -225,6 +544,22 @@ def safe_type(control, text: str, clear_first: bool = True):
     control.type_keys(text, with_spaces=True)
 
 
+# Character replacements for sanitize_filename
+_FILENAME_TRANS = str.maketrans({
+    '/': '-',
+    '\\': '-',
+    ':': '-',
+    '*': '',
+    '?': '',
+    '"': '',
+    '<': '',
+    '>': '',
+    '|': '-',
+    ' ': '_'
+})
+_FILENAME_KEEP = frozenset(string.ascii_letters + string.digits + '_-.')
+
+
 def get_timestamp() -> str:
     """Get formatted timestamp for filenames."""
     return datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -240,28 +575,11 @@ def sanitize_filename(name: str) -> str:
     Returns:
         Safe filename string
     """
-    # Replace common problematic characters
-    replacements = {
-        '/': '-',
-        '\\': '-',
-        ':': '-',
-        '*': '',
-        '?': '',
-        '"': '',
-        '<': '',
-        '>': '',
-        '|': '-',
-        ' ': '_'
-    }
-    
-    result = name
-    for old, new in replacements.items():
-        result = result.replace(old, new)
+    result = name.translate(_FILENAME_TRANS)
     
     # Remove any remaining non-alphanumeric except underscores and hyphens
-    result = ''.join(c for c in result if c.isalnum() or c in '_-.')
-    
-    return result
+    # (ASCII hits the set lookup; isalnum() keeps non-ASCII letters)
+    return ''.join(c for c in result if c in _FILENAME_KEEP or c.isalnum())
 
 
 def print_control_tree(window, max_depth: int = 3):
@@ -2,25 +2,30 @@
 """
 Configuration Management Module
 Loads and validates environment variables with fail-fast behavior.
+
+The .env file is read and validated once, on first access to a setting
+(PEP 562 module __getattr__), rather than at import time.
 """
 
 import os
+import stat
+import sys
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+from typing import Callable, Dict, Mapping, Optional
 
 # ============================================================================
 # CRITICAL CONFIGURATION - FAIL FAST
 # ============================================================================
 
-def _get_required_env(var_name: str) -> str:
+def _get_required_env(var_name: str, env: Mapping[str, str]) -> str:
     """
     Get required environment variable with fail-fast validation.
     
     Args:
         var_name: Name of the environment variable
+        env: Snapshot of stripped environment variables
         
     Returns:
         str: Value of the environment variable
@@ -28,7 +33,7 @@ def _get_required_env(var_name: str) -> str:
     Raises:
         ValueError: If the environment variable is not set or is empty
     """
-    value = os.getenv(var_name, '').strip()
+    value = env.get(var_name, '')
     if not value:
         raise ValueError(
             f"CRITICAL: Required environment variable '{var_name}' is not set or is empty. "
@@ -37,156 +42,273 @@ def _get_required_env(var_name: str) -> str:
     return value
 
 
-# ============================================================================
-# CONNECTION MODE CONFIGURATION
-# ============================================================================
-
-# Connection mode: 'SQLITE' (local P6 Professional) or 'JAVA' (JPype Integration API)
-P6_CONNECTION_MODE = os.getenv('P6_CONNECTION_MODE', 'SQLITE').strip().upper()
-
-if P6_CONNECTION_MODE not in ['SQLITE', 'JAVA']:
-    raise ValueError(
-        f"CRITICAL: P6_CONNECTION_MODE must be 'SQLITE' or 'JAVA', got: {P6_CONNECTION_MODE}"
-    )
-
-# ============================================================================
-# SQLITE CONFIGURATION (for P6 Professional Standalone)
-# ============================================================================
-
-P6_DB_PATH = os.getenv('P6_DB_PATH', '').strip()
-
-if P6_CONNECTION_MODE == 'SQLITE':
-    if not P6_DB_PATH:
-        raise ValueError(
-            "CRITICAL: P6_DB_PATH is required when P6_CONNECTION_MODE=SQLITE. "
-            "Set it to the path of your P6 SQLite database (e.g., S32DB001.db)"
-        )
-    _db_path = Path(P6_DB_PATH)
-    if not _db_path.exists():
-        raise ValueError(
-            f"CRITICAL: P6 SQLite database does not exist: {P6_DB_PATH}"
-        )
-
-# ============================================================================
-# P6 LIBRARY CONFIGURATION (for Java Integration API mode)
-# ============================================================================
-
-P6_LIB_DIR = os.getenv('P6_LIB_DIR', '').strip()
-
-if P6_CONNECTION_MODE == 'JAVA':
-    if not P6_LIB_DIR:
-        raise ValueError(
-            "CRITICAL: P6_LIB_DIR is required when P6_CONNECTION_MODE=JAVA. "
-            "Set it to the path containing P6 Integration API JAR files."
-        )
-    _lib_path = Path(P6_LIB_DIR)
-    if not _lib_path.exists() or not _lib_path.is_dir():
-        raise ValueError(
-            f"CRITICAL: P6 library directory does not exist or is not a directory: {P6_LIB_DIR}"
-        )
-
-# ============================================================================
-# DATABASE CONFIGURATION
-# ============================================================================
+def _env_lower(env: Mapping[str, str], var_name: str, default: str) -> str:
+    """
+    Read a case-insensitive setting from the environment snapshot.
+    
+    Args:
+        env: Snapshot of stripped environment variables
+        var_name: Name of the environment variable
+        default: Value used when the variable is unset
+        
+    Returns:
+        str: Lowercased value
+    """
+    return env.get(var_name, default).lower()
 
-# Database type: 'standalone' (SQLite) or 'enterprise' (Oracle)
-P6_DB_TYPE = os.getenv('P6_DB_TYPE', 'standalone').strip().lower()
 
-if P6_DB_TYPE not in ['standalone', 'enterprise']:
-    raise ValueError(
-        f"CRITICAL: P6_DB_TYPE must be 'standalone' or 'enterprise', got: {P6_DB_TYPE}"
-    )
+def _env_bool(env: Mapping[str, str], var_name: str, default: bool) -> bool:
+    """
+    Read a boolean flag ('true', '1', 'yes' or 'on', case-insensitive).
+    
+    Args:
+        env: Snapshot of stripped environment variables
+        var_name: Name of the environment variable
+        default: Value used when the variable is unset
+        
+    Returns:
+        bool: Parsed flag
+    """
+    value = env.get(var_name)
+    if value is None:
+        return default
+    return value.lower() in _TRUTHY
 
-# Database credentials (required for enterprise mode)
-if P6_DB_TYPE == 'enterprise':
-    DB_USER = _get_required_env('DB_USER')
-    DB_PASS = _get_required_env('DB_PASS')
-    DB_INSTANCE = os.getenv('DB_INSTANCE', '').strip()  # Optional database instance
-else:
-    # Standalone mode doesn't require database credentials
-    DB_USER = None
-    DB_PASS = None
-    DB_INSTANCE = None
 
-# ============================================================================
-# P6 USER CREDENTIALS
-# ============================================================================
+def _stat_is(path: str, mode_check: Callable[[int], bool]) -> bool:
+    """
+    Check a path's file type with a single stat() call.
+    
+    Args:
+        path: Filesystem path
+        mode_check: stat.S_ISREG, stat.S_ISDIR, etc.
+        
+    Returns:
+        bool: True if the path exists and matches the check
+    """
+    try:
+        return mode_check(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
 
-P6_USER = _get_required_env('P6_USER')
-P6_PASS = _get_required_env('P6_PASS')
 
 # ============================================================================
-# SAFETY CONFIGURATION
+# STATIC CONFIGURATION
 # ============================================================================
 
-# SAFE_MODE: When True, prevents write operations to P6
-# Default: True (fail-safe)
-SAFE_MODE = os.getenv('SAFE_MODE', 'true').strip().lower() in ['true', '1', 'yes']
+# Repository root (src/config/settings.py -> ../../..)
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
-# ============================================================================
-# LOGGING CONFIGURATION
-# ============================================================================
+# Project .env file
+_DOTENV_PATH = _PROJECT_ROOT / '.env'
 
 # Log directory
-LOG_DIR = Path(__file__).parent.parent.parent / 'logs'
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+LOG_DIR = _PROJECT_ROOT / 'logs'
 
 # Log file path
 LOG_FILE = LOG_DIR / 'app.log'
 
-# Log level
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').strip().upper()
+# Prefixes of environment variables read by this module
+_ENV_PREFIXES = ('P6_', 'DB_', 'LOG_', 'SAFE_', 'PDF_', 'LLM_')
 
-# ============================================================================
-# AI/LLM CONFIGURATION
-# ============================================================================
-
-# LLM Provider: anthropic, openai, gemini
-LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'anthropic').strip().lower()
+# Accepted values for validated settings
+_VALID_CONNECTION_MODES = frozenset({'SQLITE', 'JAVA'})
+_VALID_DB_TYPES = frozenset({'standalone', 'enterprise'})
+_VALID_LLM_PROVIDERS = frozenset({'anthropic', 'openai', 'gemini'})
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
 
-if LLM_PROVIDER not in ['anthropic', 'openai', 'gemini']:
-    raise ValueError(
-        f"CRITICAL: LLM_PROVIDER must be 'anthropic', 'openai', or 'gemini', got: {LLM_PROVIDER}"
-    )
-
-# LLM API Key (optional - AI features disabled if not set)
-LLM_API_KEY = os.getenv('LLM_API_KEY', '').strip()
-
-# LLM Model
+# LLM model defaults per provider
 LLM_MODEL_DEFAULTS = {
     'anthropic': 'claude-3-5-sonnet-20241022',
     'openai': 'gpt-4-turbo-preview',
     'gemini': 'gemini-1.5-pro'
 }
-LLM_MODEL = os.getenv('LLM_MODEL', LLM_MODEL_DEFAULTS[LLM_PROVIDER]).strip()
-
-# LLM Temperature (0.0 - 1.0)
-LLM_TEMPERATURE = float(os.getenv('LLM_TEMPERATURE', '0.0'))
 
-# LLM Max Tokens
-LLM_MAX_TOKENS = int(os.getenv('LLM_MAX_TOKENS', '4096'))
 
-# AI Features Enabled (True if API key is set)
-AI_ENABLED = bool(LLM_API_KEY)
-
-# ============================================================================
-# P6 GUI AUTOMATION CONFIGURATION
-# ============================================================================
-
-# Path to P6 Professional executable
-P6_EXECUTABLE_PATH = os.getenv(
-    'P6_EXECUTABLE_PATH',
-    r'C:\Program Files\Oracle\Primavera P6\P6 Professional\PM.exe'
-).strip()
+@dataclass(frozen=True)
+class _Settings:
+    """Validated environment configuration."""
+    P6_CONNECTION_MODE: str
+    P6_DB_PATH: str
+    P6_LIB_DIR: str
+    P6_DB_TYPE: str
+    DB_USER: Optional[str]
+    DB_PASS: Optional[str] = field(repr=False)
+    DB_INSTANCE: Optional[str]
+    P6_USER: str
+    P6_PASS: str = field(repr=False)
+    SAFE_MODE: bool
+    LOG_LEVEL: str
+    LLM_PROVIDER: str
+    LLM_API_KEY: str = field(repr=False)
+    LLM_MODEL: str
+    LLM_TEMPERATURE: float
+    LLM_MAX_TOKENS: int
+    AI_ENABLED: bool
+    P6_EXECUTABLE_PATH: str
+    P6_DEFAULT_LAYOUT: str
+    PDF_PRINTER_NAME: str
+    PDF_OUTPUT_DIR: str
+    P6_FAST_TIMINGS: bool
+
+
+_SETTING_NAMES = frozenset(f.name for f in fields(_Settings))
+
+__all__ = [f.name for f in fields(_Settings)] + [
+    'LOG_DIR',
+    'LOG_FILE',
+    'LLM_MODEL_DEFAULTS',
+    'print_config_summary',
+]
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> _Settings:
+    """
+    Load the .env file and validate configuration (once per process).
+        
+    Returns:
+        _Settings: Validated configuration
+        
+    Raises:
+        ValueError: If a required setting is missing or invalid
+    """
+    # Load environment variables from .env file (shell values take precedence)
+    if _DOTENV_PATH.is_file():
+        from dotenv import load_dotenv
+        load_dotenv(_DOTENV_PATH, override=False)
+    
+    # Snapshot the relevant variables once, already stripped
+    env: Dict[str, str] = {
+        k: v.strip() for k, v in os.environ.items() if k.startswith(_ENV_PREFIXES)
+    }
+    
+    # ------------------------------------------------------------------------
+    # Connection mode: 'SQLITE' (local P6 Professional) or 'JAVA' (JPype Integration API)
+    # ------------------------------------------------------------------------
+    
+    connection_mode = env.get('P6_CONNECTION_MODE', 'SQLITE').upper()
+    
+    if connection_mode not in _VALID_CONNECTION_MODES:
+        raise ValueError(
+            f"CRITICAL: P6_CONNECTION_MODE must be 'SQLITE' or 'JAVA', got: {connection_mode}"
+        )
+    
+    # ------------------------------------------------------------------------
+    # SQLite configuration (for P6 Professional Standalone)
+    # ------------------------------------------------------------------------
+    
+    db_path = env.get('P6_DB_PATH', '')
+    
+    if connection_mode == 'SQLITE':
+        if not db_path:
+            raise ValueError(
+                "CRITICAL: P6_DB_PATH is required when P6_CONNECTION_MODE=SQLITE. "
+                "Set it to the path of your P6 SQLite database (e.g., S32DB001.db)"
+            )
+        if not _stat_is(db_path, stat.S_ISREG):
+            raise ValueError(
+                f"CRITICAL: P6 SQLite database does not exist or is not a file: {db_path}"
+            )
+    
+    # ------------------------------------------------------------------------
+    # P6 library configuration (for Java Integration API mode)
+    # ------------------------------------------------------------------------
+    
+    lib_dir = env.get('P6_LIB_DIR', '')
+    
+    if connection_mode == 'JAVA':
+        if not lib_dir:
+            raise ValueError(
+                "CRITICAL: P6_LIB_DIR is required when P6_CONNECTION_MODE=JAVA. "
+                "Set it to the path containing P6 Integration API JAR files."
+            )
+        if not _stat_is(lib_dir, stat.S_ISDIR):
+            raise ValueError(
+                f"CRITICAL: P6 library directory does not exist or is not a directory: {lib_dir}"
+            )
+    
+    # ------------------------------------------------------------------------
+    # Database type: 'standalone' (SQLite) or 'enterprise' (Oracle)
+    # ------------------------------------------------------------------------
+    
+    db_type = _env_lower(env, 'P6_DB_TYPE', 'standalone')
+    
+    if db_type not in _VALID_DB_TYPES:
+        raise ValueError(
+            f"CRITICAL: P6_DB_TYPE must be 'standalone' or 'enterprise', got: {db_type}"
+        )
+    
+    # Database credentials (required for enterprise mode)
+    if db_type == 'enterprise':
+        db_user = _get_required_env('DB_USER', env)
+        db_pass = _get_required_env('DB_PASS', env)
+        db_instance = env.get('DB_INSTANCE', '')  # Optional database instance
+    else:
+        # Standalone mode doesn't require database credentials
+        db_user = None
+        db_pass = None
+        db_instance = None
+    
+    # ------------------------------------------------------------------------
+    # LLM provider: anthropic, openai, gemini
+    # ------------------------------------------------------------------------
+    
+    llm_provider = _env_lower(env, 'LLM_PROVIDER', 'anthropic')
+    
+    if llm_provider not in _VALID_LLM_PROVIDERS:
+        raise ValueError(
+            f"CRITICAL: LLM_PROVIDER must be 'anthropic', 'openai', or 'gemini', got: {llm_provider}"
+        )
+    
+    # LLM API Key (optional - AI features disabled if not set)
+    llm_api_key = env.get('LLM_API_KEY', '')
+    
+    if not os.path.isdir(LOG_DIR):
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+    
+    return _Settings(
+        P6_CONNECTION_MODE=connection_mode,
+        P6_DB_PATH=db_path,
+        P6_LIB_DIR=lib_dir,
+        P6_DB_TYPE=db_type,
+        DB_USER=db_user,
+        DB_PASS=db_pass,
+        DB_INSTANCE=db_instance,
+        # P6 user credentials
+        P6_USER=_get_required_env('P6_USER', env),
+        P6_PASS=_get_required_env('P6_PASS', env),
+        # SAFE_MODE: When True, prevents write operations to P6
+        # Default: True (fail-safe)
+        SAFE_MODE=_env_bool(env, 'SAFE_MODE', True),
+        LOG_LEVEL=env.get('LOG_LEVEL', 'INFO').upper(),
+        LLM_PROVIDER=llm_provider,
+        LLM_API_KEY=llm_api_key,
+        LLM_MODEL=env.get('LLM_MODEL', LLM_MODEL_DEFAULTS[llm_provider]),
+        # LLM Temperature (0.0 - 1.0)
+        LLM_TEMPERATURE=float(env.get('LLM_TEMPERATURE', '0.0')),
+        LLM_MAX_TOKENS=int(env.get('LLM_MAX_TOKENS', '4096')),
+        # AI Features Enabled (True if API key is set)
+        AI_ENABLED=bool(llm_api_key),
+        # P6 GUI automation
+        P6_EXECUTABLE_PATH=env.get(
+            'P6_EXECUTABLE_PATH',
+            r'C:\Program Files\Oracle\Primavera P6\P6 Professional\PM.exe'
+        ),
+        P6_DEFAULT_LAYOUT=env.get('P6_DEFAULT_LAYOUT', 'Standard Layout'),
+        PDF_PRINTER_NAME=env.get('PDF_PRINTER_NAME', 'Microsoft Print to PDF'),
+        PDF_OUTPUT_DIR=env.get('PDF_OUTPUT_DIR', 'reports/pdf'),
+        # Shorten pywinauto waits during scheduling/baseline operations
+        P6_FAST_TIMINGS=_env_bool(env, 'P6_FAST_TIMINGS', False),
+    )
 
-# Default layout for printing
-P6_DEFAULT_LAYOUT = os.getenv('P6_DEFAULT_LAYOUT', 'Standard Layout').strip()
 
-# PDF printer name
-PDF_PRINTER_NAME = os.getenv('PDF_PRINTER_NAME', 'Microsoft Print to PDF').strip()
+def __getattr__(name: str):
+    """Resolve settings lazily, loading configuration on first access."""
+    if name in _SETTING_NAMES:
+        return getattr(_load_config(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# PDF output directory
-PDF_OUTPUT_DIR = os.getenv('PDF_OUTPUT_DIR', 'reports/pdf').strip()
 
 # ============================================================================
 # CONFIGURATION SUMMARY
@@ -194,27 +316,34 @@ PDF_OUTPUT_DIR = os.getenv('PDF_OUTPUT_DIR', 'reports/pdf').strip()
 
 def print_config_summary():
     """Print a summary of the current configuration (without sensitive data)."""
-    print("=" * 60)
-    print("Configuration Summary")
-    print("=" * 60)
-    print(f"P6_CONNECTION_MODE: {P6_CONNECTION_MODE}")
-    if P6_CONNECTION_MODE == 'SQLITE':
-        print(f"P6_DB_PATH:    {P6_DB_PATH}")
+    config = _load_config()
+    lines = [
+        "=" * 60,
+        "Configuration Summary",
+        "=" * 60,
+        f"P6_CONNECTION_MODE: {config.P6_CONNECTION_MODE}",
+    ]
+    if config.P6_CONNECTION_MODE == 'SQLITE':
+        lines.append(f"P6_DB_PATH:    {config.P6_DB_PATH}")
     else:
-        print(f"P6_LIB_DIR:    {P6_LIB_DIR}")
-    print(f"P6_DB_TYPE:    {P6_DB_TYPE}")
-    print(f"P6_USER:       {P6_USER}")
-    print(f"SAFE_MODE:     {SAFE_MODE}")
-    print(f"LOG_LEVEL:     {LOG_LEVEL}")
-    print(f"LOG_FILE:      {LOG_FILE}")
-    if P6_DB_TYPE == 'enterprise':
-        print(f"DB_USER:       {DB_USER}")
-        if DB_INSTANCE:
-            print(f"DB_INSTANCE:   {DB_INSTANCE}")
-    print(f"AI_ENABLED:    {AI_ENABLED}")
-    if AI_ENABLED:
-        print(f"LLM_PROVIDER:  {LLM_PROVIDER}")
-        print(f"LLM_MODEL:     {LLM_MODEL}")
-        print(f"LLM_TEMP:      {LLM_TEMPERATURE}")
-    print("=" * 60)
-
+        lines.append(f"P6_LIB_DIR:    {config.P6_LIB_DIR}")
+    lines.extend([
+        f"P6_DB_TYPE:    {config.P6_DB_TYPE}",
+        f"P6_USER:       {config.P6_USER}",
+        f"SAFE_MODE:     {config.SAFE_MODE}",
+        f"LOG_LEVEL:     {config.LOG_LEVEL}",
+        f"LOG_FILE:      {LOG_FILE}",
+    ])
+    if config.P6_DB_TYPE == 'enterprise':
+        lines.append(f"DB_USER:       {config.DB_USER}")
+        if config.DB_INSTANCE:
+            lines.append(f"DB_INSTANCE:   {config.DB_INSTANCE}")
+    lines.append(f"AI_ENABLED:    {config.AI_ENABLED}")
+    if config.AI_ENABLED:
+        lines.extend([
+            f"LLM_PROVIDER:  {config.LLM_PROVIDER}",
+            f"LLM_MODEL:     {config.LLM_MODEL}",
+            f"LLM_TEMP:      {config.LLM_TEMPERATURE}",
+        ])
+    lines.append("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -10,14 +10,6 @@ from .definitions import (
     get_fields,
 )
 
-# P6Session requires JPype - only import if available
-try:
-    from .session import P6Session
-    _JPYPE_AVAILABLE = True
-except ImportError:
-    _JPYPE_AVAILABLE = False
-    P6Session = None
-
 __all__ = [
     'PROJECT_FIELDS',
     'ACTIVITY_FIELDS',
@@ -25,8 +17,19 @@ __all__ = [
     'RELATIONSHIP_FIELDS',
     'validate_fields',
     'get_fields',
+    'P6Session',  # None when JPype is not installed
 ]
 
-if _JPYPE_AVAILABLE:
-    __all__.append('P6Session')
 
+def __getattr__(name: str):
+    """Import P6Session on first access so schema-only callers never load JPype."""
+    if name != 'P6Session':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        from .session import P6Session
+    except ImportError:
+        P6Session = None
+    
+    globals()['P6Session'] = P6Session
+    return P6Session
@@ -5,25 +5,26 @@ Immutable constants defining the fields to retrieve from P6 entities.
 This prevents over-fetching and ensures consistent data structure.
 """
 
-from typing import List, Final
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Tuple, Final
 
 # ============================================================================
 # PROJECT FIELDS
 # ============================================================================
 
-PROJECT_FIELDS: Final[List[str]] = [
+PROJECT_FIELDS: Final[Tuple[str, ...]] = (
     'ObjectId',       # Unique internal identifier
     'Id',             # User-visible project ID
     'Name',           # Project name
     'Status',         # Project status (e.g., Active, Completed)
     'PlanStartDate',  # Planned start date
-]
+)
 
 # ============================================================================
 # ACTIVITY FIELDS
 # ============================================================================
 
-ACTIVITY_FIELDS: Final[List[str]] = [
+ACTIVITY_FIELDS: Final[Tuple[str, ...]] = (
     'ObjectId',        # Unique internal identifier
     'Id',              # User-visible activity ID
     'Name',            # Activity name
@@ -33,63 +34,74 @@ ACTIVITY_FIELDS: Final[List[str]] = [
     'FinishDate',      # Actual or planned finish date
     'TotalFloat',      # Total float in hours (critical path indicator: <= 0 means critical)
     'ProjectObjectId', # Project reference for relationship queries
-]
+)
 
 # ============================================================================
 # RESOURCE FIELDS
 # ============================================================================
 
-RESOURCE_FIELDS: Final[List[str]] = [
+RESOURCE_FIELDS: Final[Tuple[str, ...]] = (
     'ObjectId',        # Unique internal identifier
     'Id',              # User-visible resource ID
     'Name',            # Resource name
     'ResourceType',    # Resource type (e.g., Labor, Material, Equipment)
-]
+)
 
 # ============================================================================
 # RELATIONSHIP FIELDS
 # ============================================================================
 
-RELATIONSHIP_FIELDS: Final[List[str]] = [
+RELATIONSHIP_FIELDS: Final[Tuple[str, ...]] = (
     'ObjectId',                # Unique internal identifier
     'PredecessorObjectId',     # Predecessor activity reference
     'SuccessorObjectId',       # Successor activity reference
     'Type',                    # Relationship type (e.g., FS, SS, FF, SF)
     'Lag',                     # Lag time in hours
-]
+)
 
 # ============================================================================
 # FIELD VALIDATION
 # ============================================================================
 
-def validate_fields(entity_type: str, fields: List[str]) -> bool:
+# Fields per entity type, built once at import
+_FIELDS_MAP: Final[Dict[str, Tuple[str, ...]]] = {
+    'Project': PROJECT_FIELDS,
+    'Activity': ACTIVITY_FIELDS,
+    'Resource': RESOURCE_FIELDS,
+    'Relationship': RELATIONSHIP_FIELDS,
+}
+
+# Field sets per entity type for membership checks
+_VALID_FIELDS_MAP: Final[Dict[str, FrozenSet[str]]] = {
+    entity_type: frozenset(fields) for entity_type, fields in _FIELDS_MAP.items()
+}
+
+
+def validate_fields(entity_type: str, fields: Iterable[str]) -> bool:
     """
     Validate that the requested fields are defined for the entity type.
     
     Args:
         entity_type: Type of entity (e.g., 'Project', 'Activity')
-        fields: List of field names to validate
+        fields: Field names to validate
         
     Returns:
         bool: True if all fields are valid, False otherwise
     """
-    valid_fields_map = {
-        'Project': PROJECT_FIELDS,
-        'Activity': ACTIVITY_FIELDS,
-        'Resource': RESOURCE_FIELDS,
-        'Relationship': RELATIONSHIP_FIELDS,
-    }
-    
-    if entity_type not in valid_fields_map:
+    return _validate_fields_cached(entity_type, tuple(fields))
+
+
+@lru_cache(maxsize=32)
+def _validate_fields_cached(entity_type: str, fields: Tuple[str, ...]) -> bool:
+    """Memoized body of validate_fields (fields must be hashable)."""
+    valid_fields = _VALID_FIELDS_MAP.get(entity_type)
+    if valid_fields is None:
         return False
     
-    valid_fields = set(valid_fields_map[entity_type])
-    requested_fields = set(fields)
-    
-    return requested_fields.issubset(valid_fields)
+    return valid_fields.issuperset(fields)
 
 
-def get_fields(entity_type: str) -> List[str]:
+def get_fields(entity_type: str) -> Tuple[str, ...]:
     """
     Get the defined fields for an entity type.
     
@@ -97,19 +109,12 @@ def get_fields(entity_type: str) -> List[str]:
         entity_type: Type of entity (e.g., 'Project', 'Activity')
         
     Returns:
-        List[str]: List of field names for the entity type
+        Tuple[str, ...]: Field names for the entity type
         
     Raises:
         ValueError: If entity_type is not recognized
     """
-    fields_map = {
-        'Project': PROJECT_FIELDS,
-        'Activity': ACTIVITY_FIELDS,
-        'Resource': RESOURCE_FIELDS,
-        'Relationship': RELATIONSHIP_FIELDS,
-    }
-    
-    if entity_type not in fields_map:
-        raise ValueError(f"Unknown entity type: {entity_type}")
-    
-    return fields_map[entity_type]
+    try:
+        return _FIELDS_MAP[entity_type]
+    except KeyError:
+        raise ValueError(f"Unknown entity type: {entity_type}") from None
@@ -6,7 +6,7 @@ Handles JVM lifecycle, P6 connection, and session management with safety control
 
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import jpype
 import jpype.imports
@@ -23,6 +23,36 @@ from src.config import (
 )
 from src.utils import logger, log_exception
 
+# JVM state observed by this process; once started it stays up until
+# shutdownJVM, so only the "not yet started" answer needs re-checking
+_JVM_STARTED = False
+
+
+def _jvm_started() -> bool:
+    """Return whether the JVM is running, caching a positive answer."""
+    global _JVM_STARTED
+    if not _JVM_STARTED:
+        _JVM_STARTED = jpype.isJVMStarted()
+    return _JVM_STARTED
+
+
+def _noop():
+    """Safe mode check used when safe mode is off."""
+
+
+# Optional AppCDS archive for the P6 classpath. Create it once with
+#   java -XX:ArchiveClassesAtExit=~/.cache/p6/appcds.jsa -cp <classpath> <main>
+# (JDK 13+); later JVM starts map the archived classes instead of parsing
+# every JAR. A stale or mismatched archive is ignored under -Xshare:auto.
+APPCDS_ARCHIVE = Path.home() / '.cache' / 'p6' / 'appcds.jsa'
+
+
+def _jvm_args() -> Tuple[str, ...]:
+    """Return JVM startup flags, enabling class data sharing when available."""
+    if APPCDS_ARCHIVE.is_file():
+        return ('-Xshare:auto', f'-XX:SharedArchiveFile={APPCDS_ARCHIVE}')
+    return ('-Xshare:auto',)
+
 
 class P6Session:
     """
@@ -34,8 +64,32 @@ class P6Session:
     - Database connection logic (standalone vs enterprise)
     - Context manager support for automatic cleanup
     - Safety mode enforcement
+    
+    check_safe_mode() is bound per instance by the safe_mode setter: it
+    raises RuntimeError while safe mode is on and does nothing otherwise.
     """
     
+    __slots__ = (
+        'config',
+        'lib_dir',
+        'db_type',
+        'db_user',
+        'db_pass',
+        'db_instance',
+        'p6_user',
+        'p6_pass',
+        '_safe_mode',
+        'check_safe_mode',
+        '_secrets',
+        'session',
+        'active',
+        'jvm_started_by_this_instance',
+        '_classpath',
+    )
+    
+    # Classpath strings keyed by (resolved lib dir, directory mtime_ns)
+    _CLASSPATH_CACHE: Dict[Tuple[str, int], str] = {}
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize P6Session without connecting.
@@ -56,10 +110,24 @@ class P6Session:
         self.p6_pass = self.config.get('P6_PASS', P6_PASS)
         self.safe_mode = self.config.get('SAFE_MODE', SAFE_MODE)
         
+        # Credentials to redact from logged exceptions (None in standalone mode)
+        self._secrets = tuple(s for s in (self.db_pass, self.p6_pass) if s)
+        
         # State
         self.session = None
+        self.active = False
         self.jvm_started_by_this_instance = False
         
+        # Resolve the classpath up front so start_jvm (and reconnects after
+        # a failed start) skip the library directory scan
+        self._classpath: Optional[str] = None
+        if self.lib_dir and not _jvm_started():
+            try:
+                self._classpath = self._build_classpath(Path(self.lib_dir))
+            except (OSError, RuntimeError) as e:
+                # start_jvm retries and reports the failure
+                logger.debug(f"Deferred classpath build for {self.lib_dir}: {e}")
+        
         logger.info("P6Session initialized")
         logger.info(f"Database Type: {self.db_type}")
         logger.info(f"Safe Mode: {self.safe_mode}")
@@ -70,8 +138,8 @@ class P6Session:
         
         This method:
         1. Checks if JVM is already started (CRITICAL for stability)
-        2. Dynamically builds classpath from P6_LIB_DIR
-        3. Starts JVM with the classpath
+        2. Uses the classpath resolved in __init__, building it from P6_LIB_DIR if needed
+        3. Starts JVM with the classpath (and the AppCDS archive, if present)
         
         Returns:
             bool: True if JVM was started successfully or already running
@@ -80,26 +148,18 @@ class P6Session:
             RuntimeError: If JVM startup fails
         """
         # VERIFICATION POINT 1: JVM Stability Check
-        if jpype.isJVMStarted():
+        if _jvm_started():
             logger.info("JVM is already started (idempotency check passed)")
             return True
         
         try:
-            # Build classpath from JAR files
-            lib_path = Path(self.lib_dir)
-            jar_files = list(lib_path.glob('*.jar'))
-            
-            if not jar_files:
-                raise RuntimeError(f"No JAR files found in {self.lib_dir}")
-            
-            logger.info(f"Found {len(jar_files)} JAR files in {self.lib_dir}")
-            
-            # Build classpath string
-            classpath = os.pathsep.join(str(jar.absolute()) for jar in jar_files)
+            # Build classpath from JAR files (unless resolved in __init__)
+            classpath = self._classpath or self._build_classpath(Path(self.lib_dir))
+            self._classpath = classpath
             
             # Start JVM
             logger.info("Starting JVM...")
-            jpype.startJVM(classpath=classpath)
+            jpype.startJVM(*_jvm_args(), classpath=classpath)
             self.jvm_started_by_this_instance = True
             logger.info("JVM started successfully")
             
@@ -107,9 +167,62 @@ class P6Session:
             
         except Exception as e:
             logger.error("Failed to start JVM")
-            log_exception(logger, e, [self.db_pass, self.p6_pass])
+            log_exception(logger, e, self._secrets)
             raise RuntimeError(f"JVM startup failed: {e}") from e
     
+    def _build_classpath(self, lib_path: Path) -> str:
+        """
+        Build the JVM classpath from the JAR files in lib_path.
+        
+        Results are cached in-process, keyed by the directory's mtime, so
+        unchanged library directories (often on a network share) are not
+        re-enumerated by later sessions. Nothing is persisted to disk: a
+        classpath read back from a shared location could inject JARs.
+        
+        Args:
+            lib_path: Directory containing P6 Integration API JAR files
+            
+        Returns:
+            str: Classpath string
+            
+        Raises:
+            RuntimeError: If no JAR files are found
+        """
+        lib_path = lib_path.resolve()
+        mtime_ns = lib_path.stat().st_mtime_ns
+        key = (str(lib_path), mtime_ns)
+        
+        classpath = self._CLASSPATH_CACHE.get(key)
+        if classpath is not None:
+            return classpath
+        
+        # lib_path is already absolute, so join names onto it directly
+        base = str(lib_path)
+        # Sorted so the classpath order (which AppCDS archives depend on) is stable
+        jar_names = sorted(n for n in os.listdir(base) if n.lower().endswith('.jar'))
+        
+        if not jar_names:
+            raise RuntimeError(f"No JAR files found in {self.lib_dir}")
+        
+        logger.info(f"Found {len(jar_names)} JAR files in {self.lib_dir}")
+        
+        # Build classpath string
+        classpath = os.pathsep.join([os.path.join(base, n) for n in jar_names])
+        
+        self._CLASSPATH_CACHE[key] = classpath
+        return classpath
+    
+    @property
+    def safe_mode(self) -> bool:
+        """Whether write operations are blocked."""
+        return self._safe_mode
+    
+    @safe_mode.setter
+    def safe_mode(self, value: bool):
+        # Bind the check once so write paths pay nothing when safe mode is off
+        self._safe_mode = value
+        self.check_safe_mode = self._raise_safe_mode if value else _noop
+    
     def connect(self) -> bool:
         """
         Connect to P6 using the appropriate authentication method.
@@ -128,7 +241,7 @@ class P6Session:
         """
         try:
             # Ensure JVM is started
-            if not jpype.isJVMStarted():
+            if not _jvm_started():
                 logger.info("JVM not started, starting now...")
                 self.start_jvm()
             
@@ -174,6 +287,7 @@ class P6Session:
             else:
                 raise ValueError(f"Invalid database type: {self.db_type}")
             
+            self.active = True
             logger.info("✓ Successfully connected to Primavera P6")
             logger.info(f"✓ Session established for user: {self.p6_user}")
             
@@ -187,18 +301,20 @@ class P6Session:
             
         except jpype.JException as e:
             logger.error("Java exception occurred during P6 connection")
-            log_exception(logger, e, [self.db_pass, self.p6_pass])
+            log_exception(logger, e, self._secrets)
             raise RuntimeError(f"P6 connection failed: {e}") from e
             
         except Exception as e:
             logger.error("Failed to connect to P6")
-            log_exception(logger, e, [self.db_pass, self.p6_pass])
+            log_exception(logger, e, self._secrets)
             raise RuntimeError(f"P6 connection failed: {e}") from e
     
     def disconnect(self):
         """
         Disconnect from P6 and cleanup resources.
         """
+        global _JVM_STARTED
+        
         if self.session is not None:
             try:
                 logger.info("Logging out of P6 session...")
@@ -208,12 +324,14 @@ class P6Session:
                 logger.warning(f"Error during session logout: {e}")
             finally:
                 self.session = None
+                self.active = False
         
         # Only shutdown JVM if this instance started it
-        if self.jvm_started_by_this_instance and jpype.isJVMStarted():
+        if self.jvm_started_by_this_instance and _jvm_started():
             try:
                 logger.info("Shutting down JVM...")
                 jpype.shutdownJVM()
+                _JVM_STARTED = False
                 logger.info("JVM shutdown complete")
                 self.jvm_started_by_this_instance = False
             except Exception as e:
@@ -236,20 +354,19 @@ class P6Session:
         Returns:
             bool: True if session is active
         """
-        return self.session is not None
+        return self.active
     
-    def check_safe_mode(self):
+    def _raise_safe_mode(self):
         """
-        Check if safe mode is enabled and raise exception if attempting write operation.
+        Reject a write operation; bound as check_safe_mode while safe mode is on.
         
         Raises:
-            RuntimeError: If safe mode is enabled
+            RuntimeError: Always
         """
-        if self.safe_mode:
-            raise RuntimeError(
-                "SAFE_MODE is enabled. Write operations are disabled. "
-                "Set SAFE_MODE=false in .env to enable write operations."
-            )
+        raise RuntimeError(
+            "SAFE_MODE is enabled. Write operations are disabled. "
+            "Set SAFE_MODE=false in .env to enable write operations."
+        )
 
     def is_active(self) -> bool:
         """
@@ -258,7 +375,7 @@ class P6Session:
         Returns:
             bool: True if session is active
         """
-        return self.is_connected()
+        return self.active
     
     def begin_transaction(self):
         """
@@ -8,31 +8,37 @@ from .sqlite import (
     SQLiteRelationshipDAO,
 )
 
-# Java/JPype DAOs - only import if JPype is available
-try:
-    from .project_dao import ProjectDAO
-    from .activity_dao import ActivityDAO
-    from .relationship_dao import RelationshipDAO
-    _JPYPE_AVAILABLE = True
-except ImportError:
-    # SQLite mode - JPype not needed
-    _JPYPE_AVAILABLE = False
-    ProjectDAO = None
-    ActivityDAO = None
-    RelationshipDAO = None
-
 __all__ = [
     # SQLite DAOs (always available)
     'SQLiteManager',
     'SQLiteProjectDAO',
     'SQLiteActivityDAO',
     'SQLiteRelationshipDAO',
+    # Java DAOs (None when JPype is not installed)
+    'ProjectDAO',
+    'ActivityDAO',
+    'RelationshipDAO',
 ]
 
-# Only export Java DAOs if available
-if _JPYPE_AVAILABLE:
-    __all__.extend([
-        'ProjectDAO',
-        'ActivityDAO',
-        'RelationshipDAO',
-    ])
+_JAVA_DAOS = frozenset({'ProjectDAO', 'ActivityDAO', 'RelationshipDAO'})
+
+
+def __getattr__(name: str):
+    """Import the Java/JPype DAOs on first access (SQLite mode never loads JPype)."""
+    if name not in _JAVA_DAOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        from .project_dao import ProjectDAO
+        from .activity_dao import ActivityDAO
+        from .relationship_dao import RelationshipDAO
+    except ImportError:
+        # SQLite mode - JPype not needed
+        ProjectDAO = ActivityDAO = RelationshipDAO = None
+    
+    globals().update(
+        ProjectDAO=ProjectDAO,
+        ActivityDAO=ActivityDAO,
+        RelationshipDAO=RelationshipDAO,
+    )
+    return globals()[name]
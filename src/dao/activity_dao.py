@@ -4,11 +4,144 @@ Activity Data Access Object
 Handles fetching and managing P6 Activity data.
 """
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import jpype
 import pandas as pd
+from typing import Dict, List, Optional, Tuple
 
 from src.core.definitions import ACTIVITY_FIELDS
-from src.utils import logger, p6_iterator_to_list
+from src.dao.filters import string_filter
+from src.utils import logger, p6_iterator_to_columns
+
+# Field list for existence checks
+_OBJECT_ID_FIELD = ('ObjectId',)
+
+
+@lru_cache(maxsize=None)
+def _java_fields(fields: Tuple[str, ...] = ACTIVITY_FIELDS):
+    """Return a shared Java String[] of field names (requires a running JVM)."""
+    return jpype.JArray(jpype.JString)(fields)
+
+
+def _float_column(values: list) -> pd.Series:
+    """Build a float64 column; values that are not numeric become NaN."""
+    return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype('float64')
+
+
+def _date_column(values: list) -> pd.Series:
+    """Build a datetime64 column; values that cannot be parsed become NaT."""
+    return pd.to_datetime(pd.Series(values, dtype=object), errors='coerce')
+
+
+# Column builders for numeric and date ACTIVITY_FIELDS columns; other columns
+# (Ids, names, statuses) keep pandas' default inference
+_ACTIVITY_COLUMNS = {
+    'PlannedDuration': _float_column,
+    'StartDate': _date_column,
+    'FinishDate': _date_column,
+    'TotalFloat': _float_column,
+}
+
+
+def _activity_frame(columns: dict) -> pd.DataFrame:
+    """
+    Build an activity DataFrame from p6_iterator_to_columns output.
+    
+    Columns listed in _ACTIVITY_COLUMNS are converted to their typed dtype
+    in one pass. Conversion is lenient: an unexpected value (e.g. the str()
+    fallback for an unknown Java type, or a date outside the datetime64
+    range) becomes NaN/NaT instead of failing the whole fetch.
+    
+    Args:
+        columns: Dict of field name -> list of values
+        
+    Returns:
+        pd.DataFrame: Activity data with ACTIVITY_FIELDS columns
+    """
+    return pd.DataFrame(
+        {
+            name: _ACTIVITY_COLUMNS[name](values) if name in _ACTIVITY_COLUMNS else values
+            for name, values in columns.items()
+        },
+        copy=False,
+    )
+
+
+def _project_filter(project_object_id: int, filter_expr: Optional[str] = None) -> str:
+    """
+    Scope a P6 filter expression to one project.
+    
+    Args:
+        project_object_id: Project ObjectId
+        filter_expr: Optional additional filter, combined with AND
+        
+    Returns:
+        str: Filter expression
+    """
+    base_filter = f"ProjectObjectId = {project_object_id}"
+    if not filter_expr:
+        return base_filter
+    return f"{base_filter} AND ({filter_expr})"
+
+
+# ============================================================================
+# UPDATE CASTING
+# ============================================================================
+
+# java.util.Date class, resolved on first use (requires a running JVM)
+_JAVA_DATE = None
+
+
+def _java_date_cls():
+    """Return the cached java.util.Date class."""
+    global _JAVA_DATE
+    if _JAVA_DATE is None:
+        _JAVA_DATE = jpype.JClass('java.util.Date')
+    return _JAVA_DATE
+
+
+def _to_java_string(value):
+    """Cast a value to java.lang.String."""
+    return jpype.JString(str(value))
+
+
+def _to_java_double(value):
+    """Cast a value to a Java double."""
+    return jpype.JDouble(float(value))
+
+
+def _to_java_date(python_datetime):
+    """
+    Convert Python datetime to Java Date.
+    
+    VERIFICATION POINT 2: Java Casting
+    Properly converts Python datetime to Java Date object.
+    
+    Args:
+        python_datetime: Python datetime object
+        
+    Returns:
+        Java Date object, or None if the value is not a datetime
+    """
+    if not hasattr(python_datetime, 'strftime'):
+        return None
+    
+    # Convert to milliseconds since epoch
+    timestamp_ms = int(python_datetime.timestamp() * 1000)
+    
+    # Create Java Date
+    return _java_date_cls()(jpype.JLong(timestamp_ms))
+
+
+# Updatable fields: field name -> (setter, caster returning None on invalid input)
+_UPDATE_SETTERS = {
+    'Name': ('setName', _to_java_string),
+    'PlannedDuration': ('setPlannedDuration', _to_java_double),
+    'Status': ('setStatus', _to_java_string),
+    'StartDate': ('setStartDate', _to_java_date),
+    'FinishDate': ('setFinishDate', _to_java_date),
+}
 
 
 class ActivityDAO:
@@ -20,6 +153,8 @@ class ActivityDAO:
     
     VERIFICATION POINT 3: Schema Compliance
     Uses ACTIVITY_FIELDS from definitions.py to prevent over-fetching.
+    
+    Use activity_exists() for existence pre-checks; it builds no DataFrame.
     """
     
     def __init__(self, session):
@@ -54,7 +189,7 @@ class ActivityDAO:
             pd.DataFrame: DataFrame containing activity data with ACTIVITY_FIELDS columns
         """
         try:
-            logger.info(f"Fetching activities for project ObjectId: {project_object_id}")
+            logger.info("Fetching activities for project ObjectId: %s", project_object_id)
             
             # Get the P6 session object
             p6_session = self.session.session
@@ -66,53 +201,70 @@ class ActivityDAO:
             logger.info("Accessing ActivityManager")
             
             # VERIFICATION POINT 3: Schema Compliance
-            # Convert Python list to Java String array for fields
-            import jpype
-            java_fields = jpype.JArray(jpype.java.lang.String)(ACTIVITY_FIELDS)
+            # Java String array for fields (built once per process)
+            java_fields = _java_fields()
             
             # Build filter expression
             # Always filter by ProjectObjectId
-            base_filter = f"ProjectObjectId = {project_object_id}"
+            combined_filter = _project_filter(project_object_id, filter_expr)
             
-            if filter_expr:
-                # Combine with additional filter using AND
-                combined_filter = f"{base_filter} AND ({filter_expr})"
-            else:
-                combined_filter = base_filter
-            
-            java_filter = jpype.java.lang.String(combined_filter)
-            java_order = jpype.java.lang.String(order_by) if order_by else None
-            
-            logger.info(f"Loading activities with fields: {ACTIVITY_FIELDS}")
-            logger.info(f"Filter: {combined_filter}")
+            logger.info("Loading activities with fields: %s", ACTIVITY_FIELDS)
+            logger.info("Filter: %s", combined_filter)
             if order_by:
-                logger.info(f"Order by: {order_by}")
+                logger.info("Order by: %s", order_by)
             
             # Load activities using the session's loadActivities method
-            # Returns a BOIterator
-            iterator = p6_session.loadActivities(java_fields, java_filter, java_order)
+            # Returns a BOIterator (JPype converts str arguments to java.lang.String)
+            iterator = p6_session.loadActivities(java_fields, combined_filter, order_by or None)
             
             logger.info("Activities loaded, converting to Python data structure")
             
             # VERIFICATION POINT 2: Iterator Pattern
-            # Use p6_iterator_to_list which implements while iterator.hasNext()
-            activities_list = p6_iterator_to_list(iterator, ACTIVITY_FIELDS)
-            
-            logger.info(f"Converted {len(activities_list)} activities")
+            # Use p6_iterator_to_columns which implements while iterator.hasNext()
+            columns = p6_iterator_to_columns(iterator, ACTIVITY_FIELDS)
             
             # VERIFICATION POINT 1: Data Conversion
-            # p6_iterator_to_list already handles Java Date conversion
-            # Create DataFrame from the list of dictionaries
-            df = pd.DataFrame(activities_list)
+            # p6_iterator_to_columns already handles Java Date conversion
+            # Create DataFrame from the per-field column lists
+            df = _activity_frame(columns)
             
-            logger.info(f"Created DataFrame with shape: {df.shape}")
+            logger.info("Created DataFrame with shape: %s", df.shape)
             
             return df
             
         except Exception as e:
-            logger.error(f"Failed to fetch activities: {e}")
+            logger.error("Failed to fetch activities: %s", e)
             raise RuntimeError(f"Failed to fetch activities: {e}") from e
     
+    def get_activities_for_projects(self, project_object_ids: List[int], max_workers: int = 4) -> Dict[int, pd.DataFrame]:
+        """
+        Fetch activities for several projects concurrently.
+        
+        loadActivities blocks inside the JVM with the GIL released, so
+        per-project fetches overlap their server round trips. JPype attaches
+        the worker threads to the JVM on their first Java call.
+        
+        Args:
+            project_object_ids: Project ObjectIds to fetch
+            max_workers: Maximum number of concurrent fetches
+            
+        Returns:
+            Dict[int, pd.DataFrame]: Activities DataFrame per project ObjectId
+            
+        Raises:
+            RuntimeError: If any project fetch fails
+        """
+        project_object_ids = list(project_object_ids)
+        if len(project_object_ids) <= 1:
+            return {pid: self.get_activities_for_project(pid) for pid in project_object_ids}
+        
+        workers = min(max_workers, len(project_object_ids))
+        logger.info("Fetching activities for %s projects with %s workers", len(project_object_ids), workers)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            frames = executor.map(self.get_activities_for_project, project_object_ids)
+            return dict(zip(project_object_ids, frames))
+    
     def get_all_activities(self, filter_expr: Optional[str] = None, order_by: Optional[str] = None) -> pd.DataFrame:
         """
         Fetch all activities from P6 (across all projects).
@@ -133,37 +285,31 @@ class ActivityDAO:
             p6_session = self.session.session
             
             # VERIFICATION POINT 3: Schema Compliance
-            import jpype
-            java_fields = jpype.JArray(jpype.java.lang.String)(ACTIVITY_FIELDS)
-            
-            java_filter = jpype.java.lang.String(filter_expr) if filter_expr else None
-            java_order = jpype.java.lang.String(order_by) if order_by else None
+            java_fields = _java_fields()
             
-            logger.info(f"Loading activities with fields: {ACTIVITY_FIELDS}")
+            logger.info("Loading activities with fields: %s", ACTIVITY_FIELDS)
             if filter_expr:
-                logger.info(f"Filter: {filter_expr}")
+                logger.info("Filter: %s", filter_expr)
             if order_by:
-                logger.info(f"Order by: {order_by}")
+                logger.info("Order by: %s", order_by)
             
-            # Load activities
-            iterator = p6_session.loadActivities(java_fields, java_filter, java_order)
+            # Load activities (JPype converts str arguments to java.lang.String)
+            iterator = p6_session.loadActivities(java_fields, filter_expr or None, order_by or None)
             
             logger.info("Activities loaded, converting to Python data structure")
             
             # VERIFICATION POINT 2: Iterator Pattern
-            activities_list = p6_iterator_to_list(iterator, ACTIVITY_FIELDS)
-            
-            logger.info(f"Converted {len(activities_list)} activities")
+            columns = p6_iterator_to_columns(iterator, ACTIVITY_FIELDS)
             
             # Create DataFrame
-            df = pd.DataFrame(activities_list)
+            df = _activity_frame(columns)
             
-            logger.info(f"Created DataFrame with shape: {df.shape}")
+            logger.info("Created DataFrame with shape: %s", df.shape)
             
             return df
             
         except Exception as e:
-            logger.error(f"Failed to fetch all activities: {e}")
+            logger.error("Failed to fetch all activities: %s", e)
             raise RuntimeError(f"Failed to fetch all activities: {e}") from e
     
     def get_activity_by_id(self, activity_id: str, project_object_id: Optional[int] = None) -> Optional[pd.DataFrame]:
@@ -175,28 +321,28 @@ class ActivityDAO:
             project_object_id: Optional project ObjectId to narrow search
             
         Returns:
-            pd.DataFrame: DataFrame with one row, or empty DataFrame if not found
+            Optional[pd.DataFrame]: DataFrame with one row, or None if not found
         """
         try:
-            logger.info(f"Fetching activity with ID: {activity_id}")
+            logger.info("Fetching activity with ID: %s", activity_id)
             
             # Build filter
-            filter_expr = f"Id = '{activity_id}'"
+            filter_expr = string_filter('Id', activity_id)
             
             if project_object_id:
-                df = self.get_activities_for_project(project_object_id, filter_expr=filter_expr)
-            else:
-                df = self.get_all_activities(filter_expr=filter_expr)
+                filter_expr = _project_filter(project_object_id, filter_expr)
+            
+            df = self._load_first(filter_expr)
             
             if df.empty:
-                logger.warning(f"Activity not found: {activity_id}")
-            else:
-                logger.info(f"Found activity: {activity_id}")
+                logger.warning("Activity not found: %s", activity_id)
+                return None
             
+            logger.info("Found activity: %s", activity_id)
             return df
             
         except Exception as e:
-            logger.error(f"Failed to fetch activity by ID: {e}")
+            logger.error("Failed to fetch activity by ID: %s", e)
             raise RuntimeError(f"Failed to fetch activity by ID: {e}") from e
     
     def get_activity_by_object_id(self, object_id: int) -> Optional[pd.DataFrame]:
@@ -207,26 +353,61 @@ class ActivityDAO:
             object_id: Activity ObjectId (internal unique identifier)
             
         Returns:
-            pd.DataFrame: DataFrame with one row, or empty DataFrame if not found
+            Optional[pd.DataFrame]: DataFrame with one row, or None if not found
         """
         try:
-            logger.info(f"Fetching activity with ObjectId: {object_id}")
+            logger.info("Fetching activity with ObjectId: %s", object_id)
             
             # Use filter to get specific activity
-            filter_expr = f"ObjectId = {object_id}"
-            df = self.get_all_activities(filter_expr=filter_expr)
+            df = self._load_first(f"ObjectId = {object_id}")
             
             if df.empty:
-                logger.warning(f"Activity not found with ObjectId: {object_id}")
-            else:
-                logger.info(f"Found activity with ObjectId: {object_id}")
+                logger.warning("Activity not found with ObjectId: %s", object_id)
+                return None
             
+            logger.info("Found activity with ObjectId: %s", object_id)
             return df
             
         except Exception as e:
-            logger.error(f"Failed to fetch activity by ObjectId: {e}")
+            logger.error("Failed to fetch activity by ObjectId: %s", e)
             raise RuntimeError(f"Failed to fetch activity by ObjectId: {e}") from e
     
+    def _load_first(self, filter_expr: str) -> pd.DataFrame:
+        """
+        Load the first activity matching a filter.
+        
+        Point lookups stop reading the iterator after one row instead of
+        converting the full result set.
+        
+        Args:
+            filter_expr: P6 filter expression
+            
+        Returns:
+            pd.DataFrame: DataFrame with at most one row
+        """
+        iterator = self.session.session.loadActivities(_java_fields(), filter_expr, None)
+        columns = p6_iterator_to_columns(iterator, ACTIVITY_FIELDS, max_rows=1)
+        return _activity_frame(columns)
+    
+    def activity_exists(self, object_id: int) -> bool:
+        """
+        Check whether an activity exists without building a DataFrame.
+        
+        Loads only the ObjectId field and reads no rows, so callers that
+        only need a pre-check before update_activity() should use this
+        instead of get_activity_by_object_id().
+        
+        Args:
+            object_id: Activity ObjectId
+            
+        Returns:
+            bool: True if the activity exists
+        """
+        iterator = self.session.session.loadActivities(
+            _java_fields(_OBJECT_ID_FIELD), f"ObjectId = {object_id}", None
+        )
+        return iterator is not None and bool(iterator.hasNext())
+    
     def get_activities_by_status(self, status: str, project_object_id: Optional[int] = None) -> pd.DataFrame:
         """
         Fetch activities by status.
@@ -238,9 +419,9 @@ class ActivityDAO:
         Returns:
             pd.DataFrame: DataFrame containing activities with the specified status
         """
-        logger.info(f"Fetching activities with status: {status}")
+        logger.info("Fetching activities with status: %s", status)
         
-        filter_expr = f"Status = '{status}'"
+        filter_expr = string_filter('Status', status)
         
         if project_object_id:
             return self.get_activities_for_project(project_object_id, filter_expr=filter_expr)
@@ -274,8 +455,7 @@ class ActivityDAO:
             bool: True if successful
             
         Raises:
-            PermissionError: If SAFE_MODE is enabled
-            RuntimeError: If operation fails
+            RuntimeError: If SAFE_MODE is enabled or the operation fails
             
         Example:
             dao.update_activity(12345, {
@@ -284,14 +464,12 @@ class ActivityDAO:
                 'Status': 'In Progress'
             })
         """
-        import jpype
-        
         # VERIFICATION POINT 1: Write Safety Check
         self.session.check_safe_mode()
         
         try:
-            logger.info(f"Updating activity {object_id} with {len(updates_dict)} fields")
-            logger.debug(f"Updates: {updates_dict}")
+            logger.info("Updating activity %s with %s fields", object_id, len(updates_dict))
+            logger.debug("Updates: %s", updates_dict)
             
             # VERIFICATION POINT 3: Transaction Atomicity
             self.session.begin_transaction()
@@ -307,44 +485,7 @@ class ActivityDAO:
                     raise ValueError(f"Activity not found: {object_id}")
                 
                 # VERIFICATION POINT 2: Java Casting
-                # Iterate through updates and apply them
-                for field_name, new_value in updates_dict.items():
-                    if new_value is None:
-                        logger.debug(f"Skipping null value for field: {field_name}")
-                        continue
-                    
-                    # Map field names to setter methods
-                    if field_name == 'Name':
-                        activity.setName(jpype.JString(str(new_value)))
-                        logger.debug(f"Set Name: {new_value}")
-                    
-                    elif field_name == 'PlannedDuration':
-                        # VERIFICATION POINT 2: Cast to Java Double
-                        activity.setPlannedDuration(jpype.JDouble(float(new_value)))
-                        logger.debug(f"Set PlannedDuration: {new_value}")
-                    
-                    elif field_name == 'Status':
-                        activity.setStatus(jpype.JString(str(new_value)))
-                        logger.debug(f"Set Status: {new_value}")
-                    
-                    elif field_name == 'StartDate':
-                        # Convert Python datetime to Java Date
-                        if hasattr(new_value, 'strftime'):
-                            java_date = self._python_datetime_to_java_date(new_value)
-                            activity.setStartDate(java_date)
-                            logger.debug(f"Set StartDate: {new_value}")
-                        else:
-                            logger.warning(f"Invalid StartDate value: {new_value}")
-                    
-                    elif field_name == 'FinishDate':
-                        # Convert Python datetime to Java Date
-                        if hasattr(new_value, 'strftime'):
-                            java_date = self._python_datetime_to_java_date(new_value)
-                            activity.setFinishDate(java_date)
-                            logger.debug(f"Set FinishDate: {new_value}")
-                    
-                    else:
-                        logger.warning(f"Unsupported field for update: {field_name}")
+                self._apply_updates(activity, updates_dict)
                 
                 # Save changes
                 activity.update()
@@ -352,7 +493,7 @@ class ActivityDAO:
                 # VERIFICATION POINT 3: Commit Transaction
                 self.session.commit_transaction()
                 
-                logger.info(f"✓ Activity {object_id} updated successfully")
+                logger.info("✓ Activity %s updated successfully", object_id)
                 return True
                 
             except Exception as e:
@@ -361,32 +502,94 @@ class ActivityDAO:
                 raise
             
         except jpype.JException as e:
-            logger.error(f"Java exception while updating activity: {e}")
+            logger.error("Java exception while updating activity: %s", e)
             raise RuntimeError(f"Failed to update activity: {e}") from e
         except Exception as e:
-            logger.error(f"Failed to update activity: {e}")
+            logger.error("Failed to update activity: %s", e)
             raise
     
-    def _python_datetime_to_java_date(self, python_datetime):
+    def update_activities_bulk(self, updates: Dict[int, dict]) -> int:
         """
-        Convert Python datetime to Java Date.
+        Update several activities inside one transaction.
         
-        VERIFICATION POINT 2: Java Casting
-        Properly converts Python datetime to Java Date object.
+        Same field handling as update_activity(), but the safe mode check,
+        ActivityManager lookup and begin/commit happen once for the batch.
+        Any failure rolls back the whole batch.
         
         Args:
-            python_datetime: Python datetime object
+            updates: Dict of {object_id: {field_name: new_value}}
             
         Returns:
-            Java Date object
+            int: Number of activities updated
+            
+        Raises:
+            RuntimeError: If SAFE_MODE is enabled or the operation fails
         """
-        import jpype
+        # VERIFICATION POINT 1: Write Safety Check
+        self.session.check_safe_mode()
         
-        # Get Java Date class
-        JavaDate = jpype.JClass('java.util.Date')
+        if not updates:
+            return 0
         
-        # Convert to milliseconds since epoch
-        timestamp_ms = int(python_datetime.timestamp() * 1000)
+        try:
+            logger.info("Updating %s activities in one transaction", len(updates))
+            
+            # VERIFICATION POINT 3: Transaction Atomicity
+            self.session.begin_transaction()
+            
+            try:
+                activity_manager = self.session.get_global_object('ActivityManager')
+                
+                for object_id, updates_dict in updates.items():
+                    activity = activity_manager.loadActivity(jpype.JInt(object_id))
+                    
+                    if not activity:
+                        raise ValueError(f"Activity not found: {object_id}")
+                    
+                    self._apply_updates(activity, updates_dict)
+                    activity.update()
+                
+                self.session.commit_transaction()
+                
+                logger.info("✓ %s activities updated successfully", len(updates))
+                return len(updates)
+                
+            except Exception:
+                # VERIFICATION POINT 3: Rollback on Error
+                self.session.rollback_transaction()
+                raise
+            
+        except jpype.JException as e:
+            logger.error("Java exception while updating activities: %s", e)
+            raise RuntimeError(f"Failed to update activities: {e}") from e
+        except Exception as e:
+            logger.error("Failed to update activities: %s", e)
+            raise
+    
+    def _apply_updates(self, activity, updates_dict: dict):
+        """
+        Apply field updates to a loaded Java Activity via _UPDATE_SETTERS.
         
-        # Create Java Date
-        return JavaDate(jpype.JLong(timestamp_ms))
+        Args:
+            activity: Java Activity object
+            updates_dict: Dict of {field_name: new_value}; None values are skipped
+        """
+        for field_name, new_value in updates_dict.items():
+            if new_value is None:
+                logger.debug("Skipping null value for field: %s", field_name)
+                continue
+            
+            # Look up setter and Java cast for the field
+            spec = _UPDATE_SETTERS.get(field_name)
+            if spec is None:
+                logger.warning("Unsupported field for update: %s", field_name)
+                continue
+            
+            setter_name, cast = spec
+            java_value = cast(new_value)
+            if java_value is None:
+                logger.warning("Invalid %s value: %s", field_name, new_value)
+                continue
+            
+            getattr(activity, setter_name)(java_value)
+            logger.debug("Set %s: %s", field_name, new_value)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+P6 Filter Expressions
+Helpers for building P6 Integration API filter strings shared by the DAOs.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
+def string_filter(field_name: str, value: str) -> str:
+    """
+    Build a P6 equality filter on a string field.
+    
+    Single quotes in the value are doubled so names such as "Owner's Review"
+    do not break the filter expression.
+    
+    Args:
+        field_name: P6 field name (e.g., 'Status')
+        value: Value to match
+        
+    Returns:
+        str: Filter expression, e.g. "Status = 'In Progress'"
+    """
+    escaped = str(value).replace("'", "''")
+    return f"{field_name} = '{escaped}'"
@@ -4,11 +4,20 @@ Project Data Access Object
 Handles fetching and managing P6 Project data.
 """
 
-from typing import Optional
+from functools import lru_cache
+import jpype
 import pandas as pd
+from typing import Optional
 
 from src.core.definitions import PROJECT_FIELDS
-from src.utils import logger, p6_iterator_to_list
+from src.dao.filters import string_filter
+from src.utils import logger, p6_iterator_to_columns
+
+
+@lru_cache(maxsize=None)
+def _java_fields():
+    """Return a shared Java String[] of PROJECT_FIELDS (requires a running JVM)."""
+    return jpype.JArray(jpype.JString)(PROJECT_FIELDS)
 
 
 class ProjectDAO:
@@ -58,43 +67,28 @@ class ProjectDAO:
             # Get the P6 session object
             p6_session = self.session.session
             
-            # Get the EnterpriseLoadManager
-            # This is a global object that provides access to project data
-            from com.primavera.integration.client import EnterpriseLoadManager
-            
-            logger.info("Accessing EnterpriseLoadManager")
-            
-            # VERIFICATION POINT 3: Schema Compliance
-            # Convert Python list to Java String array for fields
-            import jpype
-            java_fields = jpype.JArray(jpype.java.lang.String)(PROJECT_FIELDS)
-            
-            # Prepare filter and order parameters
-            java_filter = jpype.java.lang.String(filter_expr) if filter_expr else None
-            java_order = jpype.java.lang.String(order_by) if order_by else None
-            
             logger.info(f"Loading projects with fields: {PROJECT_FIELDS}")
             if filter_expr:
                 logger.info(f"Filter: {filter_expr}")
             if order_by:
                 logger.info(f"Order by: {order_by}")
             
-            # Load projects using the session's loadProjects method
+            # VERIFICATION POINT 3: Schema Compliance
+            # Load projects using the session's loadProjects method with the
+            # shared Java field array; JPype converts filter/order strings
             # Returns a BOIterator
-            iterator = p6_session.loadProjects(java_fields, java_filter, java_order)
+            iterator = p6_session.loadProjects(_java_fields(), filter_expr, order_by)
             
             logger.info("Projects loaded, converting to Python data structure")
             
             # VERIFICATION POINT 2: Iterator Pattern
-            # Use p6_iterator_to_list which implements while iterator.hasNext()
-            projects_list = p6_iterator_to_list(iterator, PROJECT_FIELDS)
-            
-            logger.info(f"Converted {len(projects_list)} projects")
+            # Use p6_iterator_to_columns which implements while iterator.hasNext()
+            columns = p6_iterator_to_columns(iterator, PROJECT_FIELDS)
             
             # VERIFICATION POINT 1: Data Conversion
-            # p6_iterator_to_list already handles Java Date conversion
-            # Create DataFrame from the list of dictionaries
-            df = pd.DataFrame(projects_list)
+            # p6_iterator_to_columns already handles Java Date conversion
+            # Create DataFrame from the per-field column lists
+            df = pd.DataFrame(columns, copy=False)
             
             logger.info(f"Created DataFrame with shape: {df.shape}")
             
@@ -118,8 +112,7 @@ class ProjectDAO:
             logger.info(f"Fetching project with ID: {project_id}")
             
             # Use filter to get specific project
-            filter_expr = f"Id = '{project_id}'"
-            df = self.get_all_projects(filter_expr=filter_expr)
+            df = self._load_first(string_filter('Id', project_id))
             
             if df.empty:
                 logger.warning(f"Project not found: {project_id}")
@@ -145,9 +138,9 @@ class ProjectDAO:
         try:
             logger.info(f"Fetching project with ObjectId: {object_id}")
             
-            # Use filter to get specific project
-            filter_expr = f"ObjectId = {object_id}"
-            df = self.get_all_projects(filter_expr=filter_expr)
+            # P6Session exposes no typed loadProject(ObjectId) lookup, so this
+            # goes through the same loadProjects filter path, stopping at one row
+            df = self._load_first(f"ObjectId = {object_id}")
             
             if df.empty:
                 logger.warning(f"Project not found with ObjectId: {object_id}")
@@ -160,6 +153,23 @@ class ProjectDAO:
             logger.error(f"Failed to fetch project by ObjectId: {e}")
             raise RuntimeError(f"Failed to fetch project by ObjectId: {e}") from e
     
+    def _load_first(self, filter_expr: str) -> pd.DataFrame:
+        """
+        Load the first project matching a filter.
+        
+        Point lookups stop reading the iterator after one row instead of
+        converting the full result set.
+        
+        Args:
+            filter_expr: P6 filter expression
+            
+        Returns:
+            pd.DataFrame: DataFrame with at most one row
+        """
+        iterator = self.session.session.loadProjects(_java_fields(), filter_expr, None)
+        columns = p6_iterator_to_columns(iterator, PROJECT_FIELDS, max_rows=1)
+        return pd.DataFrame(columns, copy=False)
+    
     def get_active_projects(self) -> pd.DataFrame:
         """
         Fetch all active projects.
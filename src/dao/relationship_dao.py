@@ -9,7 +9,7 @@ import pandas as pd
 from typing import Optional
 
 from src.core.definitions import RELATIONSHIP_FIELDS
-from src.utils import logger, p6_iterator_to_list
+from src.utils import logger, p6_iterator_to_columns
 
 
 class RelationshipDAO:
@@ -72,11 +72,11 @@ class RelationshipDAO:
             else:
                 relationships_iterator = rel_manager.loadAllRelationships(fields_array)
             
-            # Convert to list of dicts
-            relationships_list = p6_iterator_to_list(relationships_iterator, RELATIONSHIP_FIELDS)
+            # Convert to per-field column lists
+            columns = p6_iterator_to_columns(relationships_iterator, RELATIONSHIP_FIELDS)
             
             # Create DataFrame
-            df = pd.DataFrame(relationships_list)
+            df = pd.DataFrame(columns, copy=False)
             
             if df.empty:
                 logger.warning("No relationships found")
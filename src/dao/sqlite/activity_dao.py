@@ -7,13 +7,37 @@ IMPORTANT: Duration fields are stored in HOURS in P6 SQLite.
 This DAO divides by 8.0 to convert to DAYS for the AI Agent.
 """
 
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
 import pandas as pd
 
-from src.core.definitions import ACTIVITY_FIELDS
 from src.utils import logger
 
 
+@lru_cache(maxsize=64)
+def _build_query(base_query: str, where: Tuple[str, ...] = (), order_by: Optional[str] = None) -> str:
+    """
+    Assemble a SELECT from its base, WHERE conditions and ORDER BY clause.
+    
+    Cached per query shape, so repeated calls return the identical string
+    and hit the connection's prepared statement cache.
+    
+    Args:
+        base_query: SELECT ... FROM clause
+        where: Conditions joined with AND
+        order_by: Optional ORDER BY clause
+        
+    Returns:
+        str: Complete SQL query
+    """
+    query = base_query
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    return query
+
+
 class SQLiteActivityDAO:
     """
     Data Access Object for P6 Activities via SQLite.
@@ -37,25 +61,32 @@ class SQLiteActivityDAO:
     P6 stores durations in Hours. We divide by 8.0 to match Agent's Days expectation.
     """
     
-    # SQL query with schema-matched aliases and duration conversion
+    # SQL query with schema-matched aliases; hour columns are converted
+    # to days on the DataFrame (see HOUR_COLUMNS)
     BASE_QUERY = """
         SELECT 
             task_id as ObjectId,
             task_code as Id,
             task_name as Name,
             status_code as Status,
-            COALESCE(target_drtn_hr_cnt, 0) / 8.0 as PlannedDuration,
+            target_drtn_hr_cnt as PlannedDuration,
             early_start_date as StartDate,
             early_end_date as FinishDate,
             act_start_date as ActualStartDate,
             act_end_date as ActualFinishDate,
             task_type as Type,
             cstr_type as ConstraintType,
-            COALESCE(total_float_hr_cnt, 0) / 8.0 as TotalFloat,
+            total_float_hr_cnt as TotalFloat,
             proj_id as ProjectObjectId
         FROM TASK
     """
     
+    # Date columns (stored as TEXT) parsed to datetime64 on read
+    DATE_COLUMNS = ['StartDate', 'FinishDate', 'ActualStartDate', 'ActualFinishDate']
+    
+    # Columns fetched in hours and converted to days (NULL -> 0) after the read
+    HOUR_COLUMNS = ['PlannedDuration', 'TotalFloat']
+    
     def __init__(self, manager):
         """
         Initialize SQLiteActivityDAO with a SQLiteManager.
@@ -69,6 +100,44 @@ class SQLiteActivityDAO:
         self.manager = manager
         logger.info("SQLiteActivityDAO initialized")
     
+    def _read(self, query: str, params: Sequence = ()) -> pd.DataFrame:
+        """
+        Run a query straight into a DataFrame.
+        
+        Rows go from the cursor into column buffers without an intermediate
+        list of dicts; an empty result still has the query's columns.
+        
+        Args:
+            query: SQL query
+            params: Bound parameters
+            
+        Returns:
+            pd.DataFrame: Query result
+        """
+        return self._hours_to_days(pd.read_sql_query(
+            query,
+            self.manager.connection,
+            params=params,
+            parse_dates=self.DATE_COLUMNS,
+        ))
+    
+    def _hours_to_days(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the raw hour columns to days in place.
+        
+        One vectorized multiply per column instead of per-row arithmetic
+        in SQLite; NULL hours become 0 days.
+        
+        Args:
+            df: Activities as read from TASK
+            
+        Returns:
+            pd.DataFrame: The same DataFrame, durations in days
+        """
+        for column in self.HOUR_COLUMNS:
+            df[column] = df[column].astype('float64').fillna(0.0) * 0.125
+        return df
+    
     def get_activities_for_project(
         self, 
         project_object_id: int, 
@@ -89,30 +158,18 @@ class SQLiteActivityDAO:
         try:
             logger.info(f"Fetching activities for project ObjectId: {project_object_id}")
             
-            query = self.BASE_QUERY + " WHERE proj_id = ?"
-            params = [project_object_id]
+            where = ("proj_id = ?",)
             
             if filter_expr:
-                query += f" AND ({filter_expr})"
+                where += (f"({filter_expr})",)
                 logger.info(f"Additional filter: {filter_expr}")
             
-            if order_by:
-                query += f" ORDER BY {order_by}"
-            else:
-                query += " ORDER BY task_code"  # Default ordering
-            
-            cursor = self.manager.get_cursor()
-            cursor.execute(query, params)
-            
-            rows = cursor.fetchall()
-            activities = [dict(row) for row in rows]
+            # Default ordering: task_code
+            query = _build_query(self.BASE_QUERY, where, order_by or "task_code")
             
-            logger.info(f"Fetched {len(activities)} activities")
+            df = self._read(query, (project_object_id,))
             
-            if activities:
-                df = pd.DataFrame(activities)
-            else:
-                df = pd.DataFrame(columns=ACTIVITY_FIELDS)
+            logger.info(f"Fetched {len(df)} activities")
             
             return df
             
@@ -140,34 +197,88 @@ class SQLiteActivityDAO:
         try:
             logger.info("Fetching all activities from SQLite")
             
-            query = self.BASE_QUERY
-            
-            if filter_expr:
-                query += f" WHERE {filter_expr}"
-            
-            if order_by:
-                query += f" ORDER BY {order_by}"
-            else:
-                query += " ORDER BY proj_id, task_code"
+            df = self._read(self._all_activities_query(filter_expr, order_by))
             
-            cursor = self.manager.get_cursor()
-            cursor.execute(query)
+            logger.info(f"Fetched {len(df)} activities")
             
-            rows = cursor.fetchall()
-            activities = [dict(row) for row in rows]
+            return df
             
-            logger.info(f"Fetched {len(activities)} activities")
+        except Exception as e:
+            logger.error(f"Failed to fetch all activities: {e}")
+            raise RuntimeError(f"Failed to fetch all activities: {e}") from e
+    
+    def iter_all_activities(
+        self, 
+        filter_expr: Optional[str] = None, 
+        order_by: Optional[str] = None,
+        chunk_size: int = 50_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream all activities in DataFrame chunks.
+        
+        Same query as get_all_activities(), but memory use is bounded by
+        chunk_size rather than the total row count.
+        
+        Args:
+            filter_expr: Optional SQL WHERE clause
+            order_by: Optional ORDER BY clause
+            chunk_size: Maximum rows per yielded DataFrame
             
-            if activities:
-                df = pd.DataFrame(activities)
-            else:
-                df = pd.DataFrame(columns=ACTIVITY_FIELDS)
+        Yields:
+            pd.DataFrame: Consecutive chunks of activity rows
+        """
+        logger.info(f"Streaming all activities from SQLite in chunks of {chunk_size}")
+        
+        for chunk in pd.read_sql_query(
+            self._all_activities_query(filter_expr, order_by),
+            self.manager.connection,
+            parse_dates=self.DATE_COLUMNS,
+            chunksize=chunk_size,
+        ):
+            yield self._hours_to_days(chunk)
+    
+    def _all_activities_query(self, filter_expr: Optional[str], order_by: Optional[str]) -> str:
+        """Build the cross-project activity query."""
+        where = (filter_expr,) if filter_expr else ()
+        return _build_query(self.BASE_QUERY, where, order_by or "proj_id, task_code")
+    
+    def _query_with_params(
+        self, 
+        where_clauses: List[str], 
+        params: List, 
+        project_object_id: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Fetch activities matching bound-parameter WHERE conditions.
+        
+        Values travel as ? parameters rather than being formatted into the
+        SQL, so each query shape is one statement regardless of the values
+        and user input is never spliced into the query text.
+        
+        Args:
+            where_clauses: Conditions joined with AND, using ? placeholders
+            params: Values for the placeholders, in order
+            project_object_id: Optional project filter
             
+        Returns:
+            pd.DataFrame: Matching activities, ordered like the unfiltered fetches
+        """
+        where = tuple(where_clauses)
+        if project_object_id is not None:
+            where = ("proj_id = ?",) + where
+            params = [project_object_id, *params]
+            order_by = "task_code"
+        else:
+            order_by = "proj_id, task_code"
+        
+        try:
+            df = self._read(_build_query(self.BASE_QUERY, where, order_by), params)
+            logger.info(f"Fetched {len(df)} activities")
             return df
             
         except Exception as e:
-            logger.error(f"Failed to fetch all activities: {e}")
-            raise RuntimeError(f"Failed to fetch all activities: {e}") from e
+            logger.error(f"Failed to fetch activities: {e}")
+            raise RuntimeError(f"Failed to fetch activities: {e}") from e
     
     def get_activity_by_id(
         self, 
@@ -187,25 +298,21 @@ class SQLiteActivityDAO:
         try:
             logger.info(f"Fetching activity with ID: {activity_id}")
             
-            query = self.BASE_QUERY + " WHERE task_code = ?"
+            where = ("task_code = ?",)
             params = [activity_id]
             
             if project_object_id is not None:
-                query += " AND proj_id = ?"
+                where += ("proj_id = ?",)
                 params.append(project_object_id)
             
-            cursor = self.manager.get_cursor()
-            cursor.execute(query, params)
+            query = _build_query(self.BASE_QUERY, where)
             
-            rows = cursor.fetchall()
-            activities = [dict(row) for row in rows]
+            df = self._read(query, params)
             
-            if activities:
-                df = pd.DataFrame(activities)
-                logger.info(f"Found activity: {activity_id}")
-            else:
-                df = pd.DataFrame(columns=ACTIVITY_FIELDS)
+            if df.empty:
                 logger.warning(f"Activity not found: {activity_id}")
+            else:
+                logger.info(f"Found activity: {activity_id}")
             
             return df
             
@@ -226,20 +333,14 @@ class SQLiteActivityDAO:
         try:
             logger.info(f"Fetching activity with ObjectId: {object_id}")
             
-            query = self.BASE_QUERY + " WHERE task_id = ?"
-            
-            cursor = self.manager.get_cursor()
-            cursor.execute(query, (object_id,))
+            query = _build_query(self.BASE_QUERY, ("task_id = ?",))
             
-            rows = cursor.fetchall()
-            activities = [dict(row) for row in rows]
+            df = self._read(query, (object_id,))
             
-            if activities:
-                df = pd.DataFrame(activities)
-                logger.info(f"Found activity with ObjectId: {object_id}")
-            else:
-                df = pd.DataFrame(columns=ACTIVITY_FIELDS)
+            if df.empty:
                 logger.warning(f"Activity not found with ObjectId: {object_id}")
+            else:
+                logger.info(f"Found activity with ObjectId: {object_id}")
             
             return df
             
@@ -262,12 +363,7 @@ class SQLiteActivityDAO:
         Returns:
             pd.DataFrame: DataFrame with matching activities
         """
-        filter_expr = f"status_code = '{status}'"
-        
-        if project_object_id is not None:
-            return self.get_activities_for_project(project_object_id, filter_expr=filter_expr)
-        else:
-            return self.get_all_activities(filter_expr=filter_expr)
+        return self._query_with_params(["status_code = ?"], [status], project_object_id)
     
     def update_activity(self, object_id: int, updates_dict: dict):
         """
@@ -300,10 +396,7 @@ class SQLiteActivityDAO:
         """
         # Float stored in hours. 0 hours = 0 days.
         # Use small epsilon for float comparison safety
-        return self.get_activities_for_project(
-            project_object_id, 
-            filter_expr="total_float_hr_cnt <= 0.01"
-        )
+        return self._query_with_params(["total_float_hr_cnt <= 0.01"], [], project_object_id)
     
     def get_near_critical_activities(
         self, 
@@ -321,11 +414,11 @@ class SQLiteActivityDAO:
             pd.DataFrame: Near-critical activities
         """
         threshold_hours = threshold_days * 8.0
-        filter_expr = f"total_float_hr_cnt > 0.01 AND total_float_hr_cnt <= {threshold_hours}"
         
-        return self.get_activities_for_project(
-            project_object_id, 
-            filter_expr=filter_expr
+        return self._query_with_params(
+            ["total_float_hr_cnt > 0.01", "total_float_hr_cnt <= ?"],
+            [threshold_hours],
+            project_object_id
         )
 
     def get_activities_by_float_range(
@@ -347,9 +440,9 @@ class SQLiteActivityDAO:
         """
         min_hours = min_float_days * 8.0
         max_hours = max_float_days * 8.0
-        filter_expr = f"total_float_hr_cnt >= {min_hours} AND total_float_hr_cnt <= {max_hours}"
         
-        return self.get_activities_for_project(
-            project_object_id, 
-            filter_expr=filter_expr
+        return self._query_with_params(
+            ["total_float_hr_cnt >= ?", "total_float_hr_cnt <= ?"],
+            [min_hours, max_hours],
+            project_object_id
         )
@@ -4,10 +4,9 @@ SQLite Project DAO for P6 Professional Standalone.
 Read-only access to PROJECT table with schema-matched column aliases.
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 import pandas as pd
 
-from src.core.definitions import PROJECT_FIELDS
 from src.utils import logger
 
 
@@ -39,6 +38,9 @@ class SQLiteProjectDAO:
         FROM PROJECT
     """
     
+    # Date columns (stored as TEXT) parsed to datetime64 on read
+    DATE_COLUMNS = ['PlanStartDate', 'PlanEndDate']
+    
     def __init__(self, manager):
         """
         Initialize SQLiteProjectDAO with a SQLiteManager.
@@ -52,6 +54,24 @@ class SQLiteProjectDAO:
         self.manager = manager
         logger.info("SQLiteProjectDAO initialized")
     
+    def _read(self, query: str, params: Sequence = ()) -> pd.DataFrame:
+        """
+        Run a query straight into a DataFrame, parsing the date columns.
+        
+        Args:
+            query: SQL query
+            params: Bound parameters
+            
+        Returns:
+            pd.DataFrame: Query result
+        """
+        return pd.read_sql_query(
+            query,
+            self.manager.connection,
+            params=params,
+            parse_dates=self.DATE_COLUMNS,
+        )
+    
     def get_all_projects(self, filter_expr: Optional[str] = None, order_by: Optional[str] = None) -> pd.DataFrame:
         """
         Fetch all projects from the SQLite database.
@@ -77,22 +97,9 @@ class SQLiteProjectDAO:
                 query += f" ORDER BY {order_by}"
                 logger.info(f"Order by: {order_by}")
             
-            cursor = self.manager.get_cursor()
-            cursor.execute(query, params)
-            
-            rows = cursor.fetchall()
-            
-            # Convert to list of dicts
-            projects = [dict(row) for row in rows]
-            
-            logger.info(f"Fetched {len(projects)} projects")
+            df = self._read(query, params)
             
-            # Create DataFrame
-            if projects:
-                df = pd.DataFrame(projects)
-            else:
-                # Empty DataFrame with correct columns
-                df = pd.DataFrame(columns=PROJECT_FIELDS)
+            logger.info(f"Fetched {len(df)} projects")
             
             return df
             
@@ -115,18 +122,12 @@ class SQLiteProjectDAO:
             
             query = self.BASE_QUERY + " WHERE proj_short_name = ?"
             
-            cursor = self.manager.get_cursor()
-            cursor.execute(query, (project_id,))
-            
-            rows = cursor.fetchall()
-            projects = [dict(row) for row in rows]
+            df = self._read(query, (project_id,))
             
-            if projects:
-                df = pd.DataFrame(projects)
-                logger.info(f"Found project: {project_id}")
-            else:
-                df = pd.DataFrame(columns=PROJECT_FIELDS)
+            if df.empty:
                 logger.warning(f"Project not found: {project_id}")
+            else:
+                logger.info(f"Found project: {project_id}")
             
             return df
             
@@ -149,18 +150,12 @@ class SQLiteProjectDAO:
             
             query = self.BASE_QUERY + " WHERE proj_id = ?"
             
-            cursor = self.manager.get_cursor()
-            cursor.execute(query, (object_id,))
+            df = self._read(query, (object_id,))
             
-            rows = cursor.fetchall()
-            projects = [dict(row) for row in rows]
-            
-            if projects:
-                df = pd.DataFrame(projects)
-                logger.info(f"Found project with ObjectId: {object_id}")
-            else:
-                df = pd.DataFrame(columns=PROJECT_FIELDS)
+            if df.empty:
                 logger.warning(f"Project not found with ObjectId: {object_id}")
+            else:
+                logger.info(f"Found project with ObjectId: {object_id}")
             
             return df
             
@@ -26,6 +26,14 @@ class SQLiteManager:
             projects = project_dao.get_all_projects()
     """
     
+    # Read-path tuning applied on connect. Journal pragmas (WAL, synchronous)
+    # are omitted: an immutable database has no journal and is never written.
+    READ_PRAGMAS = (
+        "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+        "PRAGMA temp_store=MEMORY",    # sorts/temp b-trees stay in RAM
+        "PRAGMA cache_size=-131072",   # 128 MB page cache
+    )
+    
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize SQLite manager.
@@ -74,6 +82,9 @@ class SQLiteManager:
             # Enable row factory for dictionary-like access
             self.connection.row_factory = sqlite3.Row
             
+            for pragma in self.READ_PRAGMAS:
+                self.connection.execute(pragma)
+            
             logger.info(f"Connected to Standalone DB: {self.db_path}")
             logger.info("Database opened in IMMUTABLE mode (read-only, no lock files)")
             
@@ -14,6 +14,7 @@ try:
         java_date_to_python,
         java_value_to_python,
         p6_iterator_to_list,
+        p6_iterator_to_columns,
         p6_objects_to_dict_list,
     )
     _JPYPE_AVAILABLE = True
@@ -23,6 +24,7 @@ except ImportError:
     java_date_to_python = None
     java_value_to_python = None
     p6_iterator_to_list = None
+    p6_iterator_to_columns = None
     p6_objects_to_dict_list = None
 
 __all__ = [
@@ -42,6 +44,7 @@ if _JPYPE_AVAILABLE:
         'java_date_to_python',
         'java_value_to_python',
         'p6_iterator_to_list',
+        'p6_iterator_to_columns',
         'p6_objects_to_dict_list',
     ])
 
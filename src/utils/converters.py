@@ -119,9 +119,12 @@ def p6_iterator_to_list(iterator: Any, fields: List[str]) -> List[Dict[str, Any]
     
     try:
         # VERIFICATION POINT 2: Iterator Pattern
-        # Use hasNext() loop instead of direct list conversion
-        while iterator.hasNext():
-            obj = iterator.next()
+        # Use hasNext() loop instead of direct list conversion; the proxy
+        # methods are bound once rather than looked up on every row
+        has_next = iterator.hasNext
+        next_obj = iterator.next
+        while has_next():
+            obj = next_obj()
             
             # Extract fields dynamically
             record = {}
@@ -150,6 +153,55 @@ def p6_iterator_to_list(iterator: Any, fields: List[str]) -> List[Dict[str, Any]
     return results
 
 
+def p6_iterator_to_columns(iterator: Any, fields: List[str], max_rows: Optional[int] = None) -> Dict[str, List[Any]]:
+    """
+    Convert P6 BOIterator to a dictionary of column lists.
+    
+    Column-oriented counterpart of p6_iterator_to_list: pd.DataFrame(columns)
+    builds each column directly instead of hashing one dict per row.
+    
+    Args:
+        iterator: P6 BOIterator object
+        fields: List of field names to extract (from definitions.py)
+        max_rows: Optional limit; iteration stops once this many rows are read
+        
+    Returns:
+        Dict mapping each field name to its list of values (all equal length)
+    """
+    columns: Dict[str, List[Any]] = {field_name: [] for field_name in fields}
+    
+    if iterator is None:
+        logger.warning("Received None iterator")
+        return columns
+    
+    appenders = [(field_name, columns[field_name].append) for field_name in fields]
+    count = 0
+    
+    try:
+        # VERIFICATION POINT 2: Iterator Pattern
+        has_next = iterator.hasNext
+        next_obj = iterator.next
+        while (max_rows is None or count < max_rows) and has_next():
+            obj = next_obj()
+            
+            for field_name, append in appenders:
+                try:
+                    # VERIFICATION POINT 1: Data Conversion
+                    append(java_value_to_python(obj.getValue(field_name)))
+                except Exception as e:
+                    logger.warning(f"Failed to get field '{field_name}': {e}")
+                    append(None)
+            
+            count += 1
+        
+        logger.info(f"Converted {count} objects from iterator")
+        
+    except Exception as e:
+        logger.error(f"Error iterating through P6 objects: {e}")
+    
+    return columns
+
+
 def p6_objects_to_dict_list(objects: Any, fields: List[str]) -> List[Dict[str, Any]]:
     """
     Convert P6 objects (from iterator or collection) to list of dictionaries.
@@ -62,3 +62,16 @@ class TestActivityDAODurationConversion:
                 if len(floats) > 0:
                     # Float values should be reasonable in days
                     assert floats.max() < 1000, "Float seems too large - may not be converted"
+
+
+@pytest.mark.integration
+class TestActivityDAOStreaming:
+    """Tests for chunked activity streaming."""
+    
+    def test_iter_all_activities_matches_full_fetch(self, activity_dao):
+        """Test that streamed chunks add up to the full result."""
+        full = activity_dao.get_all_activities()
+        chunks = list(activity_dao.iter_all_activities(chunk_size=100))
+        
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == len(full)
@@ -0,0 +1,47 @@
+"""
+Tests for the src.config export list.
+"""
+
+import importlib
+
+import src.config
+from src.config import settings
+
+
+class TestConfigExports:
+    """Every exported setting must resolve from the package."""
+    
+    def test_all_exports_importable(self):
+        """Test that every name in __all__ is importable from src.config."""
+        module = importlib.import_module('src.config')
+        for name in module.__all__:
+            assert hasattr(module, name), name
+    
+    def test_automation_settings_exported(self):
+        """Test that settings used by the automation modules are exported."""
+        for name in ('P6_CONNECTION_MODE', 'P6_DB_PATH', 'PDF_OUTPUT_DIR',
+                     'PDF_PRINTER_NAME', 'SAFE_MODE'):
+            assert name in src.config.__all__
+    
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that unknown names are not swallowed by lazy lookup."""
+        assert not hasattr(src.config, 'NOT_A_SETTING')
+
+
+class TestEnvBool:
+    """Boolean flags parse the same way for every setting."""
+    
+    def test_unset_uses_default(self):
+        """Test that a missing variable falls back to the default."""
+        assert settings._env_bool({}, 'SAFE_MODE', True) is True
+        assert settings._env_bool({}, 'SAFE_MODE', False) is False
+    
+    def test_truthy_values(self):
+        """Test that accepted truthy spellings are case-insensitive."""
+        for value in ('true', 'TRUE', '1', 'Yes', 'on'):
+            assert settings._env_bool({'SAFE_MODE': value}, 'SAFE_MODE', False) is True
+    
+    def test_other_values_are_false(self):
+        """Test that anything else, including an empty value, is False."""
+        for value in ('false', '0', 'no', ''):
+            assert settings._env_bool({'SAFE_MODE': value}, 'SAFE_MODE', True) is False
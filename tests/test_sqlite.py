@@ -7,6 +7,13 @@ from pathlib import Path
 # Original path - now works with immutable mode
 db_path = r"C:\Program Files\Oracle\Primavera P6\P6 Professional\20.12.0\Data\S32DB001.db"
 
+# sqlite3.connect would create an empty file at a missing path
+if not Path(db_path).exists():
+    if __name__ != "__main__":
+        import pytest
+        pytest.skip(f"P6 database not found: {db_path}", allow_module_level=True)
+    raise SystemExit(f"P6 database not found: {db_path}")
+
 print(f"Testing connection to: {db_path}")
 print(f"Path exists: {Path(db_path).exists()}")
 